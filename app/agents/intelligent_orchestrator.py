@@ -18,22 +18,144 @@ Outils disponibles:
 - Vision: Analyse d'images
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
+import math
 import json
-from typing import Dict, Any, List, Optional
+import re
+import reprlib
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from string import Template
+from urllib.parse import urlsplit
 
-from app.agents.adaptive_navigator import AdaptiveNavigator, StrategyType
-from app.agents.data_processor import DataProcessor, DataProcessorFactory
-from app.core.llm.base import BaseLLMClient
+import orjson
+
+# Dépendances légères uniquement: les modules lourds (Playwright, navigateur,
+# traitement de données) sont importés à la première utilisation
+from app.core.llm.base import BaseLLMClient, LLMClientError
 from app.services.search_service import searxng_client
-from app.manager import ExtractorManager
 from app.api.models import ExtractionOptions
-from app.core.data_extractor import GenericDataExtractor, DataValidator
+from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.json_utils import extract_json, IncrementalJsonParser
 
 logger = logging.getLogger(__name__)
 
+# Aperçus bornés pour l'historique des étapes: ne matérialise jamais
+# la représentation complète des gros datasets (pages extraites, etc.)
+_PREVIEW_REPR = reprlib.Repr()
+_PREVIEW_REPR.maxstring = 100
+_PREVIEW_REPR.maxother = 100
+_PREVIEW_REPR.maxlist = 3
+_PREVIEW_REPR.maxdict = 3
+_PREVIEW_REPR.maxlevel = 3
+
+# Expressions régulières précompilées (scoring et post-traitement)
+_NUM_RE = re.compile(r'\d+(?:[.,]\d+)?')
+_DATE_RE = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}|\d{2}[-/]\d{2}[-/]\d{4}')
+_UNIT_RE = re.compile(r'(\d+(?:[.,]\d+)?)\s*(%|€|millions?|milliards?|K|M|Md)')
+_NUM_WORD_RE = re.compile(r'(\d+(?:[.,]\d+)?)\s+([A-Za-zÀ-ÿ]+)')
+# Indice de source citée dans un texte (même critère que "http"/"www" en sous-chaîne)
+_URL_HINT_RE = re.compile(r'http|www')
+# Montants chiffrés (pré-filtrage de la validation de cohérence numérique)
+_AMOUNT_RE = re.compile(r'\d[\d\.,]*\s*(?:milliards?|millions?|%|€|\$)')
+# Citations [SOURCE:url] produites par la synthèse des sections
+_SOURCE_CITATION_RE = re.compile(r'\[SOURCE:(https?://[^\]]+)\]')
+# Mots candidats pour les sous-thèmes des snippets de recherche
+_TOPIC_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+_TOPIC_STOPWORDS = frozenset({
+    'this', 'that', 'with', 'from', 'have', 'more', 'will', 'your',
+    'about', 'what', 'when', 'where', 'which', 'their', 'there'
+})
+
+def _content_key(content: str) -> bytes:
+    """Empreinte de déduplication d'un contenu (le préfixe suffit à identifier un doublon)."""
+    return hashlib.blake2b(content[:4096].encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _dedupe_by_content(items: List[Dict], index: Optional[Dict[bytes, int]] = None, out: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    Ajoute les items à `out` en écartant les contenus identiques (premier vu conservé,
+    remplacé par un doublon qui apporte des données structurées absentes de l'original).
+
+    Args:
+        items: Items à ajouter
+        index: Empreinte de contenu -> position dans `out` (mis à jour)
+        out: Liste de destination (nouvelle liste si None)
+
+    Returns:
+        La liste de destination
+    """
+    if index is None:
+        index = {}
+    if out is None:
+        out = []
+
+    for item in items:
+        content = item.get("content") if isinstance(item, dict) else None
+        if not content or not isinstance(content, str):
+            out.append(item)
+            continue
+
+        key = _content_key(content)
+        pos = index.get(key)
+        if pos is None:
+            index[key] = len(out)
+            out.append(item)
+        elif item.get("structured_data") and not out[pos].get("structured_data"):
+            out[pos] = item
+
+    return out
+
+
+def _jdumps(obj: Any, limit: Optional[int] = None, indent: bool = True) -> str:
+    """
+    Sérialise en JSON pour un prompt (orjson), tronqué à limit caractères.
+
+    indent=False produit un JSON compact (~30% de tokens en moins pour les gros volumes).
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    text = orjson.dumps(obj, option=option, default=str).decode('utf-8')
+    return text if limit is None else text[:limit]
+
+
+def _bullet_list(items: List[Any]) -> str:
+    """Liste à puces markdown (une ligne "- item" par élément) construite par un seul join."""
+    return "- " + "\n- ".join(map(str, items)) if items else ""
+
+
+# Options d'extraction rapide partagées (validées une seule fois, jamais modifiées)
+_DEFAULT_EXTRACT_OPTS = ExtractionOptions(
+    timeout=30,
+    use_agent=False,  # Pas d'agent pour aller plus vite
+    headless=True
+)
+
+# Options d'extraction des sources de section (contenu nettoyé, agent autorisé)
+_SECTION_EXTRACT_OPTS = ExtractionOptions(
+    extract_images=False,
+    extract_links=False,
+    clean_html=True,
+    use_agent=True,
+    headless=True
+)
+# Durée max d'un fetch de source de section (marge sur le timeout de l'extracteur)
+_SECTION_FETCH_TIMEOUT = _SECTION_EXTRACT_OPTS.timeout + 15
+
+# Temps de génération accordé par token demandé (max_tokens), en plus de la
+# durée de base d'un appel LLM: les longues synthèses ne sont pas coupées
+_LLM_SECONDS_PER_TOKEN = 0.05
+
 
 class ToolType(str, Enum):
     """Types d'outils disponibles."""
@@ -59,7 +181,7 @@ class Tool:
         limitations: List[str]
     ):
         self.name = name
-        self.tool_type = tool_type
+        self.tool_type: str = tool_type.value  # Chaîne simple: seulement sérialisée dans les prompts
         self.capabilities = capabilities
         self.input_formats = input_formats
         self.output_format = output_format
@@ -67,19 +189,57 @@ class Tool:
         self.limitations = limitations
 
 
+@dataclass(slots=True)
+class Section:
+    """Section du rapport en construction (schéma fixe, sans dict par section)."""
+    raw_data: List[Dict] = field(default_factory=list)
+    content: str = ""
+    data_count: int = 0
+    sources: List[str] = field(default_factory=list)
+    key_data: List[Any] = field(default_factory=list)
+    word_count: int = 0  # Tenu à jour par set_content/append_content
+
+    def set_content(self, content: str):
+        """Remplace le contenu; les mots sont comptés une fois ici, pas à chaque lecture."""
+        self.content = content
+        self.word_count = len(content.split())
+
+    def append_content(self, text: str):
+        """Ajoute un paragraphe au contenu (seuls les nouveaux mots sont comptés)."""
+        self.content += f"\n\n{text}"
+        self.word_count += len(text.split())
+
+    def to_dict(self):
+        return asdict(self)
+
+
 class ExecutionContext:
     """Contexte d'exécution avec historique et apprentissage."""
 
     def __init__(self, query: str):
         self.query = query
         self.steps: List[Dict] = []
+        # Horodatage des étapes en ms relatives au début de l'exécution (monotone)
+        self._t0 = time.monotonic()
         self.datasets: Dict[str, List[Dict]] = {}
+        self._all_data: List[Dict] = []  # Union à plat des datasets (dédupliquée), maintenue à l'ajout
+        self._all_data_index: Dict[bytes, int] = {}  # Empreinte de contenu -> position dans _all_data
         self.discovered_sources: List[str] = []
-        self.tool_success_rate: Dict[str, Dict] = {}
+        self._discovered_sources_set: set[str] = set()  # Déduplication O(1), la liste garde l'ordre
+        self.tool_success_rate: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"success": 0, "failures": 0}
+        )
+        # Recherches SearXNG de la session: requête normalisée -> (max_results, tâche partagée)
+        self.search_cache: Dict[str, Tuple[int, asyncio.Future]] = {}
+        # Sections re-synthétisées depuis le dernier assemblage, et copie du dernier rapport assemblé
+        self.sections_dirty: set[str] = set()
+        self.last_assembled: Optional[Dict[str, Any]] = None
+        # Index inversé des raw_data des sections: source -> sections (une entrée par donnée)
+        self.source_index: Dict[str, List[str]] = {}
 
         # NOUVEAU: Contenu final structuré avec accumulation par section
         self.final_content: Dict[str, Any] = {
-            "sections": {},  # {section_name: {"raw_data": [], "content": "", "metadata": {}}}
+            "sections": {},  # {section_name: Section}
             "global_metadata": {
                 "sources_used": [],
                 "extraction_timestamps": [],
@@ -89,49 +249,472 @@ class ExecutionContext:
 
     def initialize_sections(self, section_names: List[str]):
         """Initialise les sections du rapport."""
-        for section_name in section_names:
-            self.final_content["sections"][section_name] = {
-                "raw_data": [],
-                "content": "",
-                "metadata": {"data_count": 0, "sources": []}
-            }
+        self.final_content["sections"].update(
+            (section_name, Section()) for section_name in section_names
+        )
         logger.info(f"📋 Sections initialisées: {', '.join(section_names)}")
 
+    def add_section_data(self, section_name: str, data: List[Dict]):
+        """Ajoute des données brutes à une section et les indexe par source."""
+        self.final_content["sections"][section_name].raw_data.extend(data)
+        for item in data:
+            source = item.get("source") if isinstance(item, dict) else None
+            if source:
+                self.source_index.setdefault(source, []).append(section_name)
+
+    def add_discovered_source(self, url: str) -> bool:
+        """Ajoute une source découverte si inédite. Retourne True si ajoutée."""
+        if url in self._discovered_sources_set:
+            return False
+        self._discovered_sources_set.add(url)
+        self.discovered_sources.append(url)
+        return True
+
     def add_step(self, tool: str, action: str, input_data: Any, output_data: Any, success: bool):
         """Enregistre une étape."""
-        input_str = str(input_data)[:100]
-        output_str = str(output_data)[:100] if output_data else ""
+        input_str = _PREVIEW_REPR.repr(input_data)[:100]
+        output_str = _PREVIEW_REPR.repr(output_data)[:100] if output_data else ""
 
         self.steps.append({
             "step_number": len(self.steps) + 1,
             "tool": tool,
             "action": action,
             "success": success,
-            "timestamp": datetime.now().isoformat(),
+            "t_ms": int((time.monotonic() - self._t0) * 1000),
             "input_preview": input_str,
             "output_preview": output_str
         })
 
         # Mettre à jour taux de succès
-        if tool not in self.tool_success_rate:
-            self.tool_success_rate[tool] = {"success": 0, "failures": 0}
-
-        if success:
-            self.tool_success_rate[tool]["success"] += 1
-        else:
-            self.tool_success_rate[tool]["failures"] += 1
+        self.tool_success_rate[tool]["success" if success else "failures"] += 1
 
     def add_dataset(self, name: str, data: List[Dict]):
         """Ajoute un dataset."""
+        replaced = name in self.datasets
         self.datasets[name] = data
+        if replaced:
+            # Cas rare: dataset écrasé, on reconstruit l'union
+            self._all_data_index = {}
+            self._all_data = _dedupe_by_content(
+                [item for dataset in self.datasets.values() for item in dataset],
+                self._all_data_index
+            )
+        else:
+            # Les mêmes pages ressortent souvent de plusieurs étapes (recherche, extraction)
+            _dedupe_by_content(data, self._all_data_index, self._all_data)
         logger.info(f"💾 Dataset '{name}' ajouté: {len(data)} items")
 
     def get_all_data(self) -> List[Dict]:
-        """Récupère toutes les données."""
-        all_data = []
-        for dataset in self.datasets.values():
-            all_data.extend(dataset)
-        return all_data
+        """Récupère toutes les données (liste partagée, ne pas modifier)."""
+        return self._all_data
+
+
+# Prompt de planification (_analyze_and_plan). Le catalogue d'outils ($tools)
+# est substitué une seule fois à l'init, le reste à chaque appel.
+_PLAN_PROMPT_TEMPLATE = Template("""Analyse cette requête et planifie la stratégie ADAPTÉE avec les outils disponibles:
+
+REQUÊTE: "$query"
+
+CONTEXTE:
+$context
+URL ou source spécifique fournie: $has_url
+Sections demandées: $sections
+
+OUTILS DISPONIBLES:
+$tools
+
+Ta mission: Créer un plan d'exécution optimal ADAPTÉ à la complexité et profondeur attendue.
+
+ÉTAPE 1: ANALYSE DE LA REQUÊTE
+Évalue ces critères pour déterminer la profondeur nécessaire:
+
+1. **Complexité du sujet** (1-5):
+   - 1 = Simple, concept unique (ex: "c'est quoi X?")
+   - 3 = Modéré, plusieurs aspects (ex: "avantages et inconvénients de X")
+   - 5 = Complexe, multidimensionnel (ex: "écosystème complet, tendances, adoption, futur de X")
+
+2. **Spécificité demandée** (1-5):
+   - 1 = Très large, vue générale
+   - 3 = Focalisé sur certains aspects
+   - 5 = Très précis, détails techniques
+
+3. **Format demandé** (1-5):
+   - 1 = Résumé court, définition
+   - 3 = Rapport standard
+   - 5 = Étude approfondie, analyse détaillée
+
+4. **Profondeur temporelle** (1-5):
+   - 1 = Point dans le temps (ex: "aujourd'hui")
+   - 3 = Période définie (ex: "2024")
+   - 5 = Évolution historique + projection future
+
+5. **Interconnexions attendues** (1-5):
+   - 1 = Sujet isolé
+   - 3 = Relations avec contexte
+   - 5 = Analyse systémique, impacts multiples
+
+ÉTAPE 2: DÉTERMINER L'AMPLEUR
+
+Calcule score_profondeur = moyenne des 5 critères
+
+- Score 1.0-2.0 → **Rapport CONCIS** (1-2 sections, 500-1000 mots total)
+- Score 2.1-3.0 → **Rapport STANDARD** (2-3 sections, 1000-1500 mots total)
+- Score 3.1-4.0 → **Rapport DÉTAILLÉ** (3-5 sections, 1500-2500 mots total)
+- Score 4.1-5.0 → **Étude APPROFONDIE** (4-7 sections, 2500-4000 mots total)
+
+Retourne JSON:
+{
+  "strategy_type": "direct|exploration|hybrid",
+  "reasoning": "Explication de la stratégie",
+  "complexity_analysis": {
+    "topic_complexity": 1-5,
+    "specificity": 1-5,
+    "format_depth": 1-5,
+    "temporal_depth": 1-5,
+    "interconnections": 1-5,
+    "overall_score": moyenne,
+    "target_length": "concis|standard|détaillé|approfondi",
+    "estimated_words": nombre_mots_total,
+    "justification": "pourquoi ce niveau de détail"
+  },
+  "data_needed": ["liste des données nécessaires"],
+  "sections": ["liste des sections du rapport"] ou null si pas de rapport,
+  "section_targets": {
+    "nom_section": {"words_target": nombre_mots, "depth": "light|moderate|deep"}
+  },
+  "steps": [
+    {
+      "step": 1,
+      "tool": "nom_outil",
+      "action": "description de l'action",
+      "input": {"query": "...", "max_results": 10},
+      "target_section": "nom de la section cible" ou null,
+      "expected_output": "ce qu'on attend"
+    }
+  ],
+  "expected_iterations": 1-5,
+  "data_processing_needed": true|false
+}
+
+STRATÉGIES OBLIGATOIRES:
+- **Si URL/source fournie**: utiliser api_navigator ou search_site (stratégie "direct")
+- **Si AUCUNE URL/source**: TOUJOURS commencer par "searxng" pour découvrir des sources (stratégie "exploration")
+- **hybrid**: Combiner plusieurs outils
+
+RÈGLES CRITIQUES:
+1. Sans URL spécifique, la première étape DOIT être "searxng"
+2. Après searxng, prévoir "webextractor" pour extraire le contenu des URLs trouvées
+3. Les étapes doivent être enchaînées logiquement
+4. Maximum 5 étapes dans le plan initial
+5. ADAPTER le nombre de sources à collecter selon la profondeur (score 1-2 = 5 sources, score 4-5 = 15 sources)
+
+EXEMPLE pour requête SIMPLE "c'est quoi Rust":
+{
+  "strategy_type": "exploration",
+  "complexity_analysis": {
+    "topic_complexity": 1,
+    "specificity": 1,
+    "format_depth": 1,
+    "temporal_depth": 1,
+    "interconnections": 1,
+    "overall_score": 1.0,
+    "target_length": "concis",
+    "estimated_words": 600,
+    "justification": "Requête simple demandant définition basique"
+  },
+  "sections": ["Définition", "Principaux usages"],
+  "section_targets": {
+    "Définition": {"words_target": 300, "depth": "light"},
+    "Principaux usages": {"words_target": 300, "depth": "light"}
+  },
+  "steps": [
+    {"step": 1, "tool": "searxng", "action": "Rechercher sources", "input": {"query": "...", "max_results": 5}},
+    {"step": 2, "tool": "webextractor", "action": "Extraire contenu", "input": {"urls": []}}
+  ]
+}
+
+EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise, roadmap":
+{
+  "strategy_type": "exploration",
+  "complexity_analysis": {
+    "topic_complexity": 5,
+    "specificity": 4,
+    "format_depth": 5,
+    "temporal_depth": 4,
+    "interconnections": 5,
+    "overall_score": 4.6,
+    "target_length": "approfondi",
+    "estimated_words": 3500,
+    "justification": "Requête complexe nécessitant analyse multidimensionnelle avec données 2024, tendances adoption, et projection future"
+  },
+  "sections": ["Vue d'ensemble", "Écosystème technique", "Adoption entreprise", "Cas d'usage", "Roadmap et futur", "Défis et perspectives"],
+  "section_targets": {
+    "Vue d'ensemble": {"words_target": 400, "depth": "moderate"},
+    "Écosystème technique": {"words_target": 700, "depth": "deep"},
+    "Adoption entreprise": {"words_target": 700, "depth": "deep"},
+    "Cas d'usage": {"words_target": 600, "depth": "moderate"},
+    "Roadmap et futur": {"words_target": 600, "depth": "deep"},
+    "Défis et perspectives": {"words_target": 500, "depth": "moderate"}
+  },
+  "steps": [
+    {"step": 1, "tool": "searxng", "action": "Rechercher sources", "input": {"query": "...", "max_results": 15}},
+    {"step": 2, "tool": "webextractor", "action": "Extraire contenu", "input": {"urls": []}}
+  ]
+}
+""")
+
+
+# Prompts de synthèse (_synthesize_answer): la structure est compilée une fois,
+# seules les données dynamiques sont substituées à chaque appel.
+_SYNTHESIS_REPORT_TEMPLATE = Template("""Analyse les données collectées et crée un rapport structuré détaillé:
+
+REQUÊTE: "$query"
+
+DONNÉES COLLECTÉES:
+- $n_pages pages web extraites avec contenu complet
+- $n_urls URLs découvertes
+- $n_sources sources avec données structurées extraites
+$structured_summary
+
+CONTENU DES PAGES EXTRAITES (avec données structurées):
+$data_json
+
+SECTIONS DEMANDÉES: $sections
+
+Ta mission: Créer un rapport complet avec TOUTES les sections demandées.
+
+INSTRUCTIONS CRITIQUES:
+1. Analyse TOUT le contenu fourni (texte + données structurées)
+2. Pour CHAQUE section demandée, rédige 4-8 paragraphes DÉTAILLÉS et COMPLETS
+3. **PRIORITÉ AUX DONNÉES STRUCTURÉES**: Utilise numerical_data, temporal_data, entities
+4. Inclus TOUS les faits précis, chiffres, dates, noms extraits automatiquement
+5. Développe chaque point avec contexte, implications, détails
+6. Base-toi UNIQUEMENT sur les données fournies
+7. Cite les URLs sources utilisées pour chaque information
+8. Pour chaque chiffre mentionné, ajoute-le aussi dans "data" structuré de la section
+9. OBJECTIF: Rapport détaillé de 3-5 pages (12000-20000 caractères minimum)
+
+Retourne JSON:
+{
+  "type": "report",
+  "summary": "Résumé exécutif en 2-3 phrases",
+  "sections": [
+    {
+      "title": "Titre section 1",
+      "content": "Contenu détaillé (2-4 paragraphes)",
+      "data": [
+        {"metric": "nom_métrique", "value": 123.45, "unit": "unité", "source_url": "https://..."},
+        ...chiffres clés de cette section
+      ],
+      "sources": [{"url": "https://...", "title": "Titre"}]
+    },
+    ...pour chaque section de $sections
+  ],
+  "bibliography": [
+    {
+      "title": "Titre de la source",
+      "url": "https://...",
+      "type": "website"
+    }
+  ],
+  "confidence": "high|medium|low"
+}
+
+IMPORTANT: Génère EXACTEMENT les sections: $sections
+""")
+
+_SYNTHESIS_SUMMARY_TEMPLATE = Template("""Synthétise la réponse à cette requête en te basant sur les données collectées:
+
+REQUÊTE: "$query"
+
+DONNÉES COLLECTÉES:
+- $n_pages pages web extraites avec contenu complet
+- $n_urls URLs découvertes
+
+CONTENU DES PAGES EXTRAITES:
+$data_json
+
+Ta mission: Créer une synthèse complète et détaillée basée sur ces données.
+
+INSTRUCTIONS:
+1. Analyse TOUT le contenu fourni
+2. Rédige une synthèse de 3-5 paragraphes minimum
+3. Identifie les points clés, initiatives, chiffres importants
+4. Structure l'information de manière logique
+5. Cite les sources pertinentes
+
+Retourne JSON:
+{
+  "type": "summary",
+  "summary": "Synthèse complète et détaillée (3-5 paragraphes)",
+  "key_points": ["point 1", "point 2", ...],
+  "sources_used": ["url1", "url2", ...],
+  "confidence": "high|medium|low"
+}
+""")
+
+
+# Prompt système de _create_detailed_plan: strictement invariant entre les appels
+# pour bénéficier du cache de préfixe côté fournisseur (cache_control Anthropic,
+# prefix caching OpenAI). Les données dynamiques vont dans le message utilisateur.
+_DETAILED_PLAN_SYSTEM_PROMPT = """Tu es un planificateur expert. Crée un plan détaillé pour répondre à la requête fournie par l'utilisateur.
+
+Ta mission: Créer un CANVAS DÉTAILLÉ avec structure complète et enchaînements.
+
+ÉTAPE 1: ANALYSE MULTI-CRITÈRES
+Évalue la complexité nécessaire (1-5 pour chaque critère):
+
+1. **Complexité du sujet**: Simple (1) → Multidimensionnel (5)
+2. **Spécificité demandée**: Large (1) → Très précis (5)
+3. **Format**: Résumé (1) → Étude approfondie (5)
+4. **Profondeur temporelle**: Point dans le temps (1) → Évolution + projection (5)
+5. **Interconnexions**: Sujet isolé (1) → Analyse systémique (5)
+
+Score moyen = profondeur globale
+
+ÉTAPE 2: DÉTERMINER AMPLEUR ET STRUCTURE
+
+Selon score_profondeur:
+- 1.0-2.0: Rapport CONCIS (1-2 sections, 500-1000 mots)
+- 2.1-3.0: Rapport STANDARD (2-3 sections, 1000-1500 mots)
+- 3.1-4.0: Rapport DÉTAILLÉ (3-5 sections, 1500-2500 mots)
+- 4.1-5.0: Étude APPROFONDIE (4-7 sections, 2500-4000 mots)
+
+ÉTAPE 3: DÉFINIR ENCHAÎNEMENTS NARRATIFS
+
+Pour chaque transition entre sections, définis:
+- Lien logique (pourquoi cette section après la précédente)
+- Type de transition (cause-effet, chronologique, zoom-in, comparaison, etc.)
+
+Retourne JSON:
+{
+  "complexity_analysis": {
+    "topic_complexity": 1-5,
+    "specificity": 1-5,
+    "format_depth": 1-5,
+    "temporal_depth": 1-5,
+    "interconnections": 1-5,
+    "overall_score": moyenne,
+    "target_length": "concis|standard|détaillé|approfondi",
+    "estimated_words": nombre_total,
+    "justification": "Pourquoi ce niveau"
+  },
+
+  "sections": ["Titre Section 1", "Titre Section 2", ...],
+
+  "section_targets": {
+    "Titre Section 1": {
+      "words_target": nombre,
+      "depth": "light|moderate|deep",
+      "objectives": ["objectif 1", "objectif 2"],
+      "key_questions": ["question à explorer 1", "question 2"]
+    },
+    ...
+  },
+
+  "narrative_flow": [
+    {
+      "from_section": "Section 1",
+      "to_section": "Section 2",
+      "transition_type": "zoom-in|cause-effect|chronological|comparison",
+      "rationale": "Pourquoi cet enchaînement"
+    },
+    ...
+  ],
+
+  "search_strategy": {
+    "total_sources_needed": nombre (adapté au score),
+    "sources_per_section": nombre,
+    "search_depth": "quick|standard|exhaustive"
+  }
+}
+
+EXEMPLES:
+
+Pour "c'est quoi Rust":
+{
+  "complexity_analysis": {"overall_score": 1.2, "target_length": "concis", "estimated_words": 600},
+  "sections": ["Définition", "Principaux usages"],
+  "section_targets": {
+    "Définition": {"words_target": 300, "depth": "light", "objectives": ["Expliquer Rust simplement"], "key_questions": ["Qu'est-ce que Rust?"]},
+    "Principaux usages": {"words_target": 300, "depth": "light", "objectives": ["Lister cas d'usage"], "key_questions": ["Pour quoi utiliser Rust?"]}
+  },
+  "narrative_flow": [{"from_section": "Définition", "to_section": "Principaux usages", "transition_type": "zoom-in", "rationale": "Après avoir défini, montrer applications concrètes"}],
+  "search_strategy": {"total_sources_needed": 5, "sources_per_section": 2, "search_depth": "quick"}
+}
+
+Pour "Écosystème Rust 2024, adoption, roadmap":
+{
+  "complexity_analysis": {"overall_score": 4.6, "target_length": "approfondi", "estimated_words": 3500},
+  "sections": ["Vue d'ensemble", "Écosystème technique", "Adoption entreprise", "Cas d'usage", "Roadmap", "Défis"],
+  "section_targets": {
+    "Vue d'ensemble": {"words_target": 400, "depth": "moderate", "objectives": ["Situer Rust en 2024"], "key_questions": ["Quelle position actuelle?", "Pourquoi pertinent?"]},
+    "Écosystème technique": {"words_target": 700, "depth": "deep", "objectives": ["Analyser tooling, libs, communauté"], "key_questions": ["Quels outils?", "Maturité?"]},
+    ...
+  },
+  "narrative_flow": [
+    {"from_section": "Vue d'ensemble", "to_section": "Écosystème technique", "transition_type": "zoom-in", "rationale": "Après contexte global, détailler aspects techniques"},
+    {"from_section": "Écosystème technique", "to_section": "Adoption entreprise", "transition_type": "cause-effect", "rationale": "Maturité technique → adoption business"},
+    ...
+  ],
+  "search_strategy": {"total_sources_needed": 15, "sources_per_section": 3, "search_depth": "exhaustive"}
+}
+"""
+
+
+# Nombre de sources recherchées par section selon sa profondeur
+_MAX_SOURCES_BY_DEPTH = {"light": 3, "moderate": 5, "deep": 8}
+
+# Consigne de longueur par profondeur de section (synthèse unitaire et groupée)
+_DEPTH_INSTRUCTIONS = {
+    "light": "Rédige 2-3 paragraphes concis allant à l'essentiel.",
+    "moderate": "Rédige 4-6 paragraphes équilibrés et informatifs.",
+    "deep": "Rédige 6-10 paragraphes détaillés explorant tous les aspects."
+}
+
+# Bornes d'un lot de synthèse groupée (taille des données injectées, tokens de sortie)
+_BATCH_SYNTHESIS_MAX_CHARS = 60000
+_BATCH_SYNTHESIS_MAX_TOKENS = 8000
+
+_BATCH_SYNTHESIS_TEMPLATE = Template("""Rédige les sections suivantes d'un rapport répondant à: "$query"
+
+$sections
+
+RÈGLES:
+1. Cite TOUTES les sources avec format [SOURCE:url]
+2. La longueur sera CONSÉQUENCE NATURELLE de la qualité, pas un objectif strict
+3. Structure: paragraphes cohérents, pas de listes à puces
+4. Ton: informatif, précis, fluide
+5. Chaque section n'utilise que ses propres données
+
+Retourne UNIQUEMENT un objet JSON dont les clés sont les titres exacts des sections
+et les valeurs leur contenu rédigé (pas de titre de section, pas de métadonnées):
+{$keys}
+""")
+
+_SECTION_SYNTHESIS_TEMPLATE = Template("""Rédige la section "$section_name" pour répondre à: "$query"
+
+OBJECTIFS DE CETTE SECTION:
+$objectives
+
+QUESTIONS CLÉS À EXPLORER:
+$key_questions
+
+INSTRUCTIONS:
+$depth_instructions
+
+DONNÉES DISPONIBLES ($n_sources sources):
+$data
+
+RÈGLES:
+1. Cite TOUTES les sources avec format [SOURCE:url]
+2. La longueur sera CONSÉQUENCE NATURELLE de la qualité, pas un objectif strict
+3. Objectif approximatif: ~$words_target mots
+4. Structure: paragraphes cohérents, pas de listes à puces
+5. Ton: informatif, précis, fluide
+
+Rédige uniquement le contenu (pas de titre de section, pas de métadonnées).
+""")
 
 
 class IntelligentOrchestrator:
@@ -139,17 +722,60 @@ class IntelligentOrchestrator:
     Orchestrateur intelligent qui connaît ses outils et s'adapte dynamiquement.
     """
 
-    def __init__(self, llm_client: BaseLLMClient, timeout: int = 300):
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        timeout: int = 300,
+        max_parallel_sections: int = 4,
+        max_concurrent_llm: int = 8,
+        max_concurrent_search: int = 6,
+        llm_timeout: float = 60.0
+    ):
         self.llm_client = llm_client
         self.timeout = timeout
+        # Durée max de base d'un appel LLM (hors attente d'admission), allongée
+        # selon max_tokens: un appel bloqué échoue seul au lieu d'épuiser le
+        # timeout global de la phase
+        self.llm_timeout = llm_timeout
+        # Nombre max de sections construites en parallèle (limites de débit LLM)
+        self.max_parallel_sections = max_parallel_sections
+        # Admission globale des appels LLM (toutes phases confondues): les phases
+        # parallèles se partagent la même file au lieu de cumuler leurs limites
+        self._llm_semaphore = asyncio.Semaphore(max_concurrent_llm)
+        # Idem pour SearXNG: les sections parallèles ne saturent pas l'instance
+        self._search_semaphore = asyncio.Semaphore(max_concurrent_search)
+        # Nombre max de sessions d'extraction (navigateur headless) simultanées
+        self._extract_semaphore = asyncio.Semaphore(5)
+        # Cache borné (LRU) des scores de pertinence statiques par empreinte de contenu:
+        # seul un float est conservé par page, pas de copie du texte
+        self._content_features_cache = TTLCache(maxsize=4096, ttl=3600)
+        # Sortie JSON garantie par le provider quand il le permet (mode JSON)
+        self._json_mode = llm_client.json_mode_params()
+        # Cache des réponses LLM (prompt identique, TTL court)
+        self._llm_cache = TTLCache(maxsize=512, ttl=300)
+        # Extractions de pages des sections par URL (tâche partagée: les sections
+        # qui demandent la même URL en même temps attendent le même fetch)
+        self._url_cache = TTLCache(maxsize=512, ttl=600)
 
         # Initialiser les outils
+        from app.agents.adaptive_navigator import AdaptiveNavigator
+        from app.manager import ExtractorManager
+        from app.core.data_extractor import GenericDataExtractor
+
         self.adaptive_navigator = AdaptiveNavigator(llm_client, timeout)
         self.extractor_manager = ExtractorManager()
         self.data_extractor = GenericDataExtractor(llm_client)
 
-        # Catalogue d'outils
+        # Catalogue d'outils (immuable après l'init: description sérialisée une seule fois)
         self.tools = self._init_tools_catalog()
+        # Liste markdown: même information que du JSON indenté, bien moins de tokens
+        self._tools_desc_md = "\n".join(
+            f"- {tool.name} ({tool.tool_type}) — best for: {', '.join(tool.best_for)} → {tool.output_format}"
+            for tool in self.tools.values()
+        )
+        self._plan_prompt_static = Template(
+            _PLAN_PROMPT_TEMPLATE.safe_substitute(tools=self._tools_desc_md)
+        )
 
     def _init_tools_catalog(self) -> Dict[str, Tool]:
         """Initialise le catalogue d'outils."""
@@ -229,6 +855,8 @@ class IntelligentOrchestrator:
         """
         logger.info(f"🧠 Recherche intelligente REFONDÉE: {query}")
         start_time = datetime.now()
+        # Logs détaillés construits seulement si INFO est actif (production en WARNING)
+        log_info = logger.isEnabledFor(logging.INFO)
 
         ctx = ExecutionContext(query)
         context = context or {}
@@ -240,15 +868,17 @@ class IntelligentOrchestrator:
         logger.info("🔍 PHASE 1: Exploration + Planification détaillée")
 
         # Étape 1.1: Exploration initiale restreinte pour évaluer le champ
-        exploration_data = await self._exploratory_phase(query, context)
-        logger.info(f"  ✓ Exploration: {len(exploration_data.get('sources', []))} sources découvertes")
-        logger.info(f"  ✓ Champ évalué: {exploration_data.get('field_assessment', 'N/A')}")
+        exploration_data = await self._exploratory_phase(query, context, ctx)
+        if log_info:
+            logger.info(f"  ✓ Exploration: {len(exploration_data.get('sources', []))} sources découvertes")
+            logger.info(f"  ✓ Champ évalué: {exploration_data.get('field_assessment', 'N/A')}")
 
         # Étape 1.2: Planification avec canvas détaillé basé sur exploration
         plan = await self._create_detailed_plan(query, context, exploration_data)
-        logger.info(f"  ✓ Canvas structure: {len(plan.get('sections', []))} sections")
-        logger.info(f"  ✓ Profondeur: {plan.get('complexity_analysis', {}).get('target_length', 'N/A')}")
-        logger.info(f"  ✓ Enchaînements définis: {len(plan.get('narrative_flow', []))} transitions")
+        if log_info:
+            logger.info(f"  ✓ Canvas structure: {len(plan.get('sections', []))} sections")
+            logger.info(f"  ✓ Profondeur: {plan.get('complexity_analysis', {}).get('target_length', 'N/A')}")
+            logger.info(f"  ✓ Enchaînements définis: {len(plan.get('narrative_flow', []))} transitions")
 
         # Initialiser les sections du canvas
         if 'sections' in plan and plan['sections']:
@@ -260,51 +890,68 @@ class IntelligentOrchestrator:
         # ===================================================================
         logger.info("🏗️  PHASE 2: Construction itérative section par section")
 
-        # Pour chaque section du canvas, processus complet
-        for section_name, section_config in plan.get('section_targets', {}).items():
-            logger.info(f"\n  📝 Section: {section_name}")
-            logger.info(f"     Profondeur: {section_config.get('depth', 'moderate')}")
-            logger.info(f"     Objectif: ~{section_config.get('words_target', 500)} mots")
-
-            # Étape 2.1: Recherches ciblées pour cette section
-            section_data = await self._section_research_phase(
-                query=query,
-                section_name=section_name,
-                section_config=section_config,
-                exploration_data=exploration_data,
-                context=ctx
-            )
-            logger.info(f"     ✓ {len(section_data.get('sources', []))} sources collectées")
+        # Les sections sont indépendantes: collecte en parallèle (bornée),
+        # puis synthèse groupée (peu d'appels LLM pour toutes les sections).
+        # TaskGroup + timeout: les appels LLM/HTTP en cours sont annulés proprement
+        # si self.timeout est dépassé (au lieu de tourner pour rien).
+        section_targets = plan.get('section_targets', {})
+        section_semaphore = asyncio.Semaphore(self.max_parallel_sections)
+        section_tasks: Dict[str, asyncio.Task] = {}
+        # Échéance unique pour toute la phase (collecte + synthèse)
+        phase_deadline = asyncio.get_running_loop().time() + self.timeout
+        try:
+            async with asyncio.timeout_at(phase_deadline):
+                async with asyncio.TaskGroup() as tg:
+                    for section_name, section_config in section_targets.items():
+                        section_tasks[section_name] = tg.create_task(
+                            self._build_section(
+                                query=query,
+                                section_name=section_name,
+                                section_config=section_config,
+                                exploration_data=exploration_data,
+                                context=ctx,
+                                semaphore=section_semaphore
+                            )
+                        )
+        except TimeoutError:
+            logger.warning(f"  ⏱️ Timeout Phase 2 ({self.timeout}s): sections en cours annulées")
+
+        # Étape 2.3: Croisement avec données existantes, en série dans l'ordre
+        # du plan: chaque section voit les sources des sections précédentes
+        enriched_per_section: Dict[str, List[Dict]] = {}
+        for section_name, task in section_tasks.items():
+            if task.cancelled():
+                logger.warning(f"  ⚠️ Section '{section_name}' annulée (timeout)")
+                continue
 
-            # Étape 2.2: Extraction et analyse des sources
-            extracted_data = await self._section_extraction_phase(
-                section_name=section_name,
-                section_data=section_data,
-                context=ctx
-            )
-            logger.info(f"     ✓ {len(extracted_data)} contenus extraits")
+            extracted_data = task.result()
+            if extracted_data is None:
+                continue
 
-            # Étape 2.3: Croisement avec données existantes
             enriched_data = self._cross_reference_data(
                 section_name=section_name,
                 new_data=extracted_data,
                 context=ctx
             )
-            logger.info(f"     ✓ {len(enriched_data)} données enrichies")
+            ctx.add_section_data(section_name, enriched_data)
+            enriched_per_section[section_name] = enriched_data
 
-            # Étape 2.4: Synthèse de la section
-            section_content = await self._synthesize_single_section(
-                query=query,
-                section_name=section_name,
-                section_config=section_config,
-                enriched_data=enriched_data,
-                context=ctx
-            )
-            logger.info(f"     ✓ Contenu généré: {len(section_content.split())} mots")
+        # Étape 2.4: Synthèse des sections (par lots)
+        section_contents: Dict[str, str] = {}
+        try:
+            async with asyncio.timeout_at(phase_deadline):
+                section_contents = await self._synthesize_sections_batch(
+                    query=query,
+                    section_targets=section_targets,
+                    enriched_per_section=enriched_per_section,
+                    context=ctx
+                )
+        except TimeoutError:
+            logger.warning(f"  ⏱️ Timeout Phase 2 ({self.timeout}s): synthèse des sections interrompue")
 
-            # Stocker dans le canvas
-            ctx.final_content['sections'][section_name]['content'] = section_content
-            ctx.final_content['sections'][section_name]['raw_data'] = enriched_data
+        # Stocker dans le canvas
+        for section_name, section_content in section_contents.items():
+            ctx.final_content['sections'][section_name].set_content(section_content)
 
         # ===================================================================
         # PHASE 3: COHÉRENCE GLOBALE PARTIE PAR PARTIE
@@ -317,7 +964,8 @@ class IntelligentOrchestrator:
             plan=plan,
             context=ctx
         )
-        logger.info(f"  ✓ {len(coherence_analysis.get('improvements', []))} améliorations identifiées")
+        if log_info:
+            logger.info(f"  ✓ {len(coherence_analysis.get('improvements', []))} améliorations identifiées")
 
         # Étape 3.2: Application des améliorations de cohérence
         await self._apply_coherence_improvements(
@@ -359,195 +1007,32 @@ class IntelligentOrchestrator:
         """
         Analyse la requête et planifie la stratégie avec les outils disponibles.
         """
-        # Construire description des outils
-        tools_desc = []
-        for tool in self.tools.values():
-            tools_desc.append({
-                "name": tool.name,
-                "type": tool.tool_type,
-                "best_for": tool.best_for,
-                "output": tool.output_format
-            })
-
         # Détecter si on a une URL ou source précise
         has_url = bool(context.get("url") or context.get("sources_required"))
 
         # Extraire les sections demandées (si présentes dans le contexte)
         requested_sections = context.get("output_sections") or []
 
-        prompt = f"""Analyse cette requête et planifie la stratégie ADAPTÉE avec les outils disponibles:
-
-REQUÊTE: "{query}"
-
-CONTEXTE:
-{json.dumps(context, indent=2) if context else "Aucun"}
-URL ou source spécifique fournie: {"OUI" if has_url else "NON"}
-Sections demandées: {requested_sections if requested_sections else "À déterminer"}
-
-OUTILS DISPONIBLES:
-{json.dumps(tools_desc, indent=2)}
-
-Ta mission: Créer un plan d'exécution optimal ADAPTÉ à la complexité et profondeur attendue.
-
-ÉTAPE 1: ANALYSE DE LA REQUÊTE
-Évalue ces critères pour déterminer la profondeur nécessaire:
-
-1. **Complexité du sujet** (1-5):
-   - 1 = Simple, concept unique (ex: "c'est quoi X?")
-   - 3 = Modéré, plusieurs aspects (ex: "avantages et inconvénients de X")
-   - 5 = Complexe, multidimensionnel (ex: "écosystème complet, tendances, adoption, futur de X")
-
-2. **Spécificité demandée** (1-5):
-   - 1 = Très large, vue générale
-   - 3 = Focalisé sur certains aspects
-   - 5 = Très précis, détails techniques
-
-3. **Format demandé** (1-5):
-   - 1 = Résumé court, définition
-   - 3 = Rapport standard
-   - 5 = Étude approfondie, analyse détaillée
-
-4. **Profondeur temporelle** (1-5):
-   - 1 = Point dans le temps (ex: "aujourd'hui")
-   - 3 = Période définie (ex: "2024")
-   - 5 = Évolution historique + projection future
-
-5. **Interconnexions attendues** (1-5):
-   - 1 = Sujet isolé
-   - 3 = Relations avec contexte
-   - 5 = Analyse systémique, impacts multiples
-
-ÉTAPE 2: DÉTERMINER L'AMPLEUR
-
-Calcule score_profondeur = moyenne des 5 critères
-
-- Score 1.0-2.0 → **Rapport CONCIS** (1-2 sections, 500-1000 mots total)
-- Score 2.1-3.0 → **Rapport STANDARD** (2-3 sections, 1000-1500 mots total)
-- Score 3.1-4.0 → **Rapport DÉTAILLÉ** (3-5 sections, 1500-2500 mots total)
-- Score 4.1-5.0 → **Étude APPROFONDIE** (4-7 sections, 2500-4000 mots total)
-
-Retourne JSON:
-{{
-  "strategy_type": "direct|exploration|hybrid",
-  "reasoning": "Explication de la stratégie",
-  "complexity_analysis": {{
-    "topic_complexity": 1-5,
-    "specificity": 1-5,
-    "format_depth": 1-5,
-    "temporal_depth": 1-5,
-    "interconnections": 1-5,
-    "overall_score": moyenne,
-    "target_length": "concis|standard|détaillé|approfondi",
-    "estimated_words": nombre_mots_total,
-    "justification": "pourquoi ce niveau de détail"
-  }},
-  "data_needed": ["liste des données nécessaires"],
-  "sections": ["liste des sections du rapport"] ou null si pas de rapport,
-  "section_targets": {{
-    "nom_section": {{"words_target": nombre_mots, "depth": "light|moderate|deep"}}
-  }},
-  "steps": [
-    {{
-      "step": 1,
-      "tool": "nom_outil",
-      "action": "description de l'action",
-      "input": {{"query": "...", "max_results": 10}},
-      "target_section": "nom de la section cible" ou null,
-      "expected_output": "ce qu'on attend"
-    }}
-  ],
-  "expected_iterations": 1-5,
-  "data_processing_needed": true|false
-}}
-
-STRATÉGIES OBLIGATOIRES:
-- **Si URL/source fournie**: utiliser api_navigator ou search_site (stratégie "direct")
-- **Si AUCUNE URL/source**: TOUJOURS commencer par "searxng" pour découvrir des sources (stratégie "exploration")
-- **hybrid**: Combiner plusieurs outils
-
-RÈGLES CRITIQUES:
-1. Sans URL spécifique, la première étape DOIT être "searxng"
-2. Après searxng, prévoir "webextractor" pour extraire le contenu des URLs trouvées
-3. Les étapes doivent être enchaînées logiquement
-4. Maximum 5 étapes dans le plan initial
-5. ADAPTER le nombre de sources à collecter selon la profondeur (score 1-2 = 5 sources, score 4-5 = 15 sources)
-
-EXEMPLE pour requête SIMPLE "c'est quoi Rust":
-{{
-  "strategy_type": "exploration",
-  "complexity_analysis": {{
-    "topic_complexity": 1,
-    "specificity": 1,
-    "format_depth": 1,
-    "temporal_depth": 1,
-    "interconnections": 1,
-    "overall_score": 1.0,
-    "target_length": "concis",
-    "estimated_words": 600,
-    "justification": "Requête simple demandant définition basique"
-  }},
-  "sections": ["Définition", "Principaux usages"],
-  "section_targets": {{
-    "Définition": {{"words_target": 300, "depth": "light"}},
-    "Principaux usages": {{"words_target": 300, "depth": "light"}}
-  }},
-  "steps": [
-    {{"step": 1, "tool": "searxng", "action": "Rechercher sources", "input": {{"query": "...", "max_results": 5}}}},
-    {{"step": 2, "tool": "webextractor", "action": "Extraire contenu", "input": {{"urls": []}}}}
-  ]
-}}
-
-EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise, roadmap":
-{{
-  "strategy_type": "exploration",
-  "complexity_analysis": {{
-    "topic_complexity": 5,
-    "specificity": 4,
-    "format_depth": 5,
-    "temporal_depth": 4,
-    "interconnections": 5,
-    "overall_score": 4.6,
-    "target_length": "approfondi",
-    "estimated_words": 3500,
-    "justification": "Requête complexe nécessitant analyse multidimensionnelle avec données 2024, tendances adoption, et projection future"
-  }},
-  "sections": ["Vue d'ensemble", "Écosystème technique", "Adoption entreprise", "Cas d'usage", "Roadmap et futur", "Défis et perspectives"],
-  "section_targets": {{
-    "Vue d'ensemble": {{"words_target": 400, "depth": "moderate"}},
-    "Écosystème technique": {{"words_target": 700, "depth": "deep"}},
-    "Adoption entreprise": {{"words_target": 700, "depth": "deep"}},
-    "Cas d'usage": {{"words_target": 600, "depth": "moderate"}},
-    "Roadmap et futur": {{"words_target": 600, "depth": "deep"}},
-    "Défis et perspectives": {{"words_target": 500, "depth": "moderate"}}
-  }},
-  "steps": [
-    {{"step": 1, "tool": "searxng", "action": "Rechercher sources", "input": {{"query": "...", "max_results": 15}}}},
-    {{"step": 2, "tool": "webextractor", "action": "Extraire contenu", "input": {{"urls": []}}}}
-  ]
-}}
-"""
+        prompt = self._plan_prompt_static.substitute(
+            query=query,
+            # Sérialisation compacte (orjson, sans indentation)
+            context=_jdumps(context, indent=False) if context else "Aucun",
+            has_url="OUI" if has_url else "NON",
+            sections=requested_sections if requested_sections else "À déterminer"
+        )
 
-        response = await self.llm_client.generate(
+        response = await self._generate(
             [{"role": "user", "content": prompt}],
             max_tokens=2000,
-            temperature=0.2
+            temperature=0.2,
+            stop_at_json=True,
+            **self._json_mode
         )
 
-        # Parser JSON
-        try:
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            plan = json.loads(response[start_idx:i + 1])
-                            return plan
-        except:
-            pass
+        # Parser JSON (scanner C, gère les accolades dans les chaînes)
+        plan = extract_json(response)
+        if isinstance(plan, dict):
+            return plan
 
         # Fallback: plan exploration avec SearXNG
         return {
@@ -626,7 +1111,7 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
 
                 logger.info(f"  🔍 Recherche SearXNG: {query}")
 
-                results = await searxng_client.search(query, max_results=max_results)
+                results = await self._cached_search(query, max_results=max_results, ctx=ctx)
 
                 if results:
                     # Extraire URLs et titres
@@ -638,8 +1123,7 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
                             "snippet": result.content
                         })
                         # Déduplication des sources
-                        if result.url not in ctx.discovered_sources:
-                            ctx.discovered_sources.append(result.url)
+                        ctx.add_discovered_source(result.url)
 
                     ctx.add_dataset(f"searxng_{len(ctx.steps)}", urls_data)
                     ctx.add_step(tool_name, action, input_data, urls_data, True)
@@ -655,11 +1139,18 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
                 urls = input_data.get("urls", [])
 
                 # Si pas d'URLs fournies, chercher dans les données précédentes
+                # (dédupliquées, arrêt dès que la limite de 5 est atteinte)
                 if not urls:
-                    all_data = ctx.get_all_data()
-                    for item in all_data:
-                        if isinstance(item, dict) and "url" in item:
-                            urls.append(item["url"])
+                    urls = []
+                    seen = set()
+                    for item in ctx.get_all_data():
+                        if isinstance(item, dict):
+                            url = item.get("url")
+                            if url and url not in seen:
+                                seen.add(url)
+                                urls.append(url)
+                                if len(urls) >= 5:
+                                    break
 
                 if not urls:
                     return {"success": False, "error": "Aucune URL à extraire"}
@@ -668,42 +1159,23 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
                 urls = urls[:5]
                 logger.info(f"  📄 Extraction: {len(urls)} URLs")
 
-                extracted_data = []
-                for url in urls:
-                    try:
-                        extract_result = await self.extractor_manager.extract(
-                            url=url,
-                            llm_client=self.llm_client,
-                            options=ExtractionOptions(
-                                timeout=30,
-                                use_agent=False,  # Pas d'agent pour aller plus vite
-                                headless=True
-                            )
-                        )
+                topic_context = ctx.query if hasattr(ctx, 'query') else ""
 
-                        if extract_result.success:
-                            # Extraction données structurées AUTOMATIQUE
-                            topic_context = ctx.query if hasattr(ctx, 'query') else ""
-                            structured = await self.data_extractor.extract_structured_data(
-                                content=extract_result.content or "",
-                                source_url=url,
-                                topic_context=topic_context
-                            )
+                # URLs indépendantes: extraction en parallèle (bornée par _extract_semaphore)
+                results = await asyncio.gather(
+                    *[self._extract_one(url, _DEFAULT_EXTRACT_OPTS) for url in urls],
+                    return_exceptions=True
+                )
+                extracted_data = [r for r in results if isinstance(r, dict)]
 
-                            extracted_data.append({
-                                "url": url,
-                                "title": extract_result.title or "",
-                                "content": extract_result.content or "",
-                                "content_type": extract_result.content_type or "unknown",
-                                "metadata": extract_result.metadata if hasattr(extract_result, 'metadata') else {},
-                                "structured_data": structured.to_dict()  # DONNÉES STRUCTURÉES
-                            })
-                            logger.info(f"  ✅ Extraction réussie: {url[:60]}... ({len(structured.numerical)} num)")
-                        else:
-                            logger.warning(f"  ⚠️ Échec extraction {url}: {extract_result.error if hasattr(extract_result, 'error') else 'Unknown'}")
-                    except Exception as e:
-                        logger.error(f"  ❌ Erreur extraction {url}: {e}")
-                        continue
+                # Extraction données structurées AUTOMATIQUE, en un seul appel LLM
+                structured_list = await self.data_extractor.extract_structured_data_batch(
+                    docs=[(item["url"], item["content"]) for item in extracted_data],
+                    topic_context=topic_context
+                )
+                for item, structured in zip(extracted_data, structured_list):
+                    item["structured_data"] = structured.to_dict()  # DONNÉES STRUCTURÉES
+                    logger.info(f"  ✅ Extraction réussie: {item['url'][:60]}... ({len(structured.numerical)} num)")
 
                 if extracted_data:
                     ctx.add_dataset(f"extracted_{len(ctx.steps)}", extracted_data)
@@ -723,6 +1195,8 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
                 operation = input_data.get("operation", "")
                 params = input_data.get("params", {})
 
+                from app.agents.data_processor import DataProcessor, DataProcessorFactory
+
                 processor = DataProcessor(all_data)
 
                 # Appliquer l'opération
@@ -745,19 +1219,186 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
                 else:
                     result_data = all_data
 
-                ctx.add_dataset(f"processed_{len(ctx.steps)}", result_data)
-                ctx.add_step(tool_name, action, input_data, result_data, True)
+                ctx.add_dataset(f"processed_{len(ctx.steps)}", result_data)
+                ctx.add_step(tool_name, action, input_data, result_data, True)
+
+                return {"success": True, "data": result_data}
+
+            else:
+                logger.warning(f"  ⚠️ Outil inconnu: {tool_name}")
+                return {"success": False, "error": f"Outil inconnu: {tool_name}"}
+
+        except Exception as e:
+            logger.error(f"Erreur exécution étape: {e}", exc_info=True)
+            ctx.add_step(tool_name, action, input_data, None, False)
+            return {"success": False, "error": str(e)}
+
+    def _llm_call_timeout(self, kwargs: Dict[str, Any]) -> float:
+        """Durée max d'un appel LLM: base + temps de génération des max_tokens demandés."""
+        return self.llm_timeout + kwargs.get("max_tokens", 0) * _LLM_SECONDS_PER_TOKEN
+
+    async def _generate(
+        self,
+        messages: List[Dict[str, str]],
+        stop_at_json: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Appel LLM direct (sans cache), soumis à l'admission globale des appels LLM.
+
+        Args:
+            stop_at_json: Streamer la réponse et couper la génération dès que
+                le premier objet JSON est complet (voir _generate_until_json)
+        """
+        generate = self._generate_until_json if stop_at_json else self.llm_client.generate
+        async with self._llm_semaphore:
+            async with asyncio.timeout(self._llm_call_timeout(kwargs)):
+                return await generate(messages, **kwargs)
+
+    async def _cached_generate(
+        self,
+        messages: List[Dict[str, str]],
+        ttl: Optional[float] = None,
+        stop_at_json: bool = False,
+        **kwargs
+    ) -> str:
+        """
+        Appel LLM avec cache des réponses pour des prompts identiques.
+
+        La clé couvre les messages (donc les données injectées dans le prompt)
+        et les paramètres de génération: une donnée modifiée invalide l'entrée.
+
+        Args:
+            stop_at_json: Streamer la réponse et couper la génération dès que
+                le premier objet JSON est complet (voir _generate_until_json)
+        """
+        generate = self._generate_until_json if stop_at_json else self.llm_client.generate
+
+        if not settings.enable_caching:
+            async with self._llm_semaphore:
+                async with asyncio.timeout(self._llm_call_timeout(kwargs)):
+                    return await generate(messages, **kwargs)
+
+        key = hashlib.blake2b(
+            json.dumps([messages, kwargs, stop_at_json], sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'),
+            digest_size=16
+        ).digest()
+
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            logger.debug("  ♻️ Cache LLM: réponse réutilisée")
+            return cached
+
+        async with self._llm_semaphore:
+            async with asyncio.timeout(self._llm_call_timeout(kwargs)):
+                response = await generate(messages, **kwargs)
+        if response:
+            self._llm_cache.set(key, response, ttl=ttl)
+        return response
+
+    async def _generate_until_json(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> str:
+        """
+        Génère en streaming et s'arrête dès que le premier objet JSON est fermé.
+
+        Évite d'attendre la fin d'une génération longue (commentaires ajoutés
+        après le JSON). Les providers sans streaming renvoient un seul fragment.
+
+        Returns:
+            Texte du JSON reçu (ou réponse complète si aucun JSON n'est fermé)
+        """
+        parser = IncrementalJsonParser()
+
+        stream = self.llm_client.generate_stream(messages, **kwargs)
+        try:
+            async for chunk in stream:
+                if parser.feed(chunk):
+                    logger.debug("  ✂️ Génération interrompue: JSON complet reçu")
+                    return parser.text[parser.start:parser.end]
+        finally:
+            await stream.aclose()
+
+        return parser.text
+
+    async def _cached_search(
+        self,
+        query: str,
+        max_results: int,
+        ctx: Optional[ExecutionContext] = None
+    ) -> List:
+        """
+        Recherche SearXNG avec cache par session (ctx.search_cache).
 
-                return {"success": True, "data": result_data}
+        La clé normalise la requête (casse, ordre des mots) pour mutualiser
+        les sous-requêtes de sections qui se recoupent. La recherche en cours
+        est enregistrée avant d'être attendue: les sections parallèles qui
+        posent la même requête attendent le même appel. Un résultat obtenu avec
+        plus de résultats que demandé est réutilisé (tronqué).
+        """
+        if ctx is None:
+            return await self._search(query, max_results)
 
-            else:
-                logger.warning(f"  ⚠️ Outil inconnu: {tool_name}")
-                return {"success": False, "error": f"Outil inconnu: {tool_name}"}
+        key = " ".join(sorted(query.lower().split()))
+        entry = ctx.search_cache.get(key)
+        if entry is not None and entry[0] >= max_results:
+            logger.debug(f"  ♻️ Cache recherche: {query}")
+            results = await asyncio.shield(entry[1])
+            return results[:max_results] if results else results
 
-        except Exception as e:
-            logger.error(f"Erreur exécution étape: {e}", exc_info=True)
-            ctx.add_step(tool_name, action, input_data, None, False)
-            return {"success": False, "error": str(e)}
+        task = asyncio.ensure_future(self._search(query, max_results))
+        ctx.search_cache[key] = (max_results, task)
+
+        def forget_empty(done: asyncio.Future):
+            # Échecs et recherches vides non conservés (une autre section réessaiera)
+            if done.cancelled() or done.exception() is not None or not done.result():
+                if ctx.search_cache.get(key, (0, None))[1] is done:
+                    del ctx.search_cache[key]
+
+        task.add_done_callback(forget_empty)
+
+        # shield: l'annulation d'une section n'interrompt pas la recherche partagée
+        return await asyncio.shield(task)
+
+    async def _search(self, query: str, max_results: int) -> List:
+        """Appel SearXNG soumis à l'admission globale des recherches."""
+        async with self._search_semaphore:
+            return await searxng_client.search(query, max_results=max_results)
+
+    async def _extract_one(
+        self,
+        url: str,
+        options: ExtractionOptions
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extrait le contenu brut d'une URL (sans données structurées).
+
+        Retourne le dictionnaire de la page extraite, ou None en cas d'échec.
+        """
+        async with self._extract_semaphore:
+            try:
+                extract_result = await self.extractor_manager.extract(
+                    url=url,
+                    llm_client=self.llm_client,
+                    options=options
+                )
+
+                if not extract_result.success:
+                    logger.warning(f"  ⚠️ Échec extraction {url}: {extract_result.error if hasattr(extract_result, 'error') else 'Unknown'}")
+                    return None
+
+                return {
+                    "url": url,
+                    "title": extract_result.title or "",
+                    "content": extract_result.content or "",
+                    "content_type": extract_result.content_type or "unknown",
+                    "metadata": extract_result.metadata if hasattr(extract_result, 'metadata') else {}
+                }
+            except Exception as e:
+                logger.error(f"  ❌ Erreur extraction {url}: {e}")
+                return None
 
     async def _evaluate_result(
         self,
@@ -774,7 +1415,7 @@ EXEMPLE pour requête APPROFONDIE "écosystème Rust 2024, adoption entreprise,
 REQUÊTE INITIALE: "{query}"
 
 DONNÉES COLLECTÉES: {len(all_data)} items
-Échantillon: {json.dumps(all_data[:3], indent=2, ensure_ascii=False) if all_data else "Aucune"}
+Échantillon: {_jdumps(all_data[:3]) if all_data else "Aucune"}
 
 ÉTAPES DÉJÀ EXÉCUTÉES: {len(ctx.steps)}
 
@@ -802,26 +1443,20 @@ RÈGLES:
 - Privilégier traitement données existantes avant nouvelles recherches
 """
 
-        response = await self.llm_client.generate(
-            [{"role": "user", "content": prompt}],
-            max_tokens=1500,
-            temperature=0.2
-        )
+        try:
+            response = await self._cached_generate(
+                [{"role": "user", "content": prompt}],
+                max_tokens=1500,
+                temperature=0.2
+            )
+        except (LLMClientError, TimeoutError) as e:
+            logger.error(f"  ❌ Erreur évaluation: {e}")
+            response = ""
 
         # Parser JSON
-        try:
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            return json.loads(response[start_idx:i + 1])
-        except:
-            pass
+        evaluation = extract_json(response)
+        if isinstance(evaluation, dict):
+            return evaluation
 
         # Fallback
         return {
@@ -891,28 +1526,17 @@ RÈGLES:
         # Validation croisée des données numériques
         validated_data = None
         if all_structured_data:
-            from app.core.data_extractor import StructuredData
-            structured_objects = []
-            for sd in all_structured_data:
-                # Reconstruire objets StructuredData
-                try:
-                    structured_objects.append(StructuredData(
-                        source_url=sd.get("source_url", ""),
-                        numerical=[],  # Simplifié pour validation
-                        temporal=[],
-                        entities=[],
-                        relationships=[],
-                        extraction_timestamp=sd.get("extraction_timestamp", ""),
-                        overall_confidence=sd.get("overall_confidence", 0.0)
-                    ))
-                except:
-                    pass
-
-            if structured_objects:
-                common_metrics = DataValidator.find_common_metrics(structured_objects)
-                if common_metrics:
-                    validated_data = DataValidator.validate_numerical_coherence(common_metrics)
-                    logger.info(f"✓ Validation croisée: {len(common_metrics)} métriques communes trouvées")
+            from app.core.data_extractor import DataValidator
+
+            # Aplatir les données numériques (une passe, sans reconstruire de StructuredData)
+            common_metrics = DataValidator.find_common_metrics_flat(
+                (num, sd.get("source_url", ""))
+                for sd in all_structured_data if isinstance(sd, dict)
+                for num in sd.get("numerical", []) if isinstance(num, dict)
+            )
+            if common_metrics:
+                validated_data = DataValidator.validate_numerical_coherence(common_metrics)
+                logger.info(f"✓ Validation croisée: {len(common_metrics)} métriques communes trouvées")
 
         # Récupérer le format de sortie demandé
         output_structure = self.current_context.get("output_structure", "summary")
@@ -928,124 +1552,50 @@ RÈGLES:
                     if metric.get('coherent'):
                         structured_summary += f"- {metric['metric']}: {metric['mean']:.2f} (validé par {len(metric['values'])} sources)\n"
 
-            prompt = f"""Analyse les données collectées et crée un rapport structuré détaillé:
-
-REQUÊTE: "{query}"
-
-DONNÉES COLLECTÉES:
-- {len(extracted_contents)} pages web extraites avec contenu complet
-- {len(urls_info)} URLs découvertes
-- {len(all_structured_data)} sources avec données structurées extraites
-{structured_summary}
-
-CONTENU DES PAGES EXTRAITES (avec données structurées):
-{json.dumps(data_for_synthesis, indent=2, ensure_ascii=False)[:60000]}
-
-SECTIONS DEMANDÉES: {output_sections}
-
-Ta mission: Créer un rapport complet avec TOUTES les sections demandées.
-
-INSTRUCTIONS CRITIQUES:
-1. Analyse TOUT le contenu fourni (texte + données structurées)
-2. Pour CHAQUE section demandée, rédige 4-8 paragraphes DÉTAILLÉS et COMPLETS
-3. **PRIORITÉ AUX DONNÉES STRUCTURÉES**: Utilise numerical_data, temporal_data, entities
-4. Inclus TOUS les faits précis, chiffres, dates, noms extraits automatiquement
-5. Développe chaque point avec contexte, implications, détails
-6. Base-toi UNIQUEMENT sur les données fournies
-7. Cite les URLs sources utilisées pour chaque information
-8. Pour chaque chiffre mentionné, ajoute-le aussi dans "data" structuré de la section
-9. OBJECTIF: Rapport détaillé de 3-5 pages (12000-20000 caractères minimum)
-
-Retourne JSON:
-{{
-  "type": "report",
-  "summary": "Résumé exécutif en 2-3 phrases",
-  "sections": [
-    {{
-      "title": "Titre section 1",
-      "content": "Contenu détaillé (2-4 paragraphes)",
-      "data": [
-        {{"metric": "nom_métrique", "value": 123.45, "unit": "unité", "source_url": "https://..."}},
-        ...chiffres clés de cette section
-      ],
-      "sources": [{{"url": "https://...", "title": "Titre"}}]
-    }},
-    ...pour chaque section de {output_sections}
-  ],
-  "bibliography": [
-    {{
-      "title": "Titre de la source",
-      "url": "https://...",
-      "type": "website"
-    }}
-  ],
-  "confidence": "high|medium|low"
-}}
-
-IMPORTANT: Génère EXACTEMENT les sections: {output_sections}
-"""
+            prompt = _SYNTHESIS_REPORT_TEMPLATE.substitute(
+                query=query,
+                n_pages=len(extracted_contents),
+                n_urls=len(urls_info),
+                n_sources=len(all_structured_data),
+                structured_summary=structured_summary,
+                data_json=_jdumps(data_for_synthesis, 60000),
+                sections=output_sections
+            )
         else:
             # Format simple: synthèse globale
-            prompt = f"""Synthétise la réponse à cette requête en te basant sur les données collectées:
-
-REQUÊTE: "{query}"
-
-DONNÉES COLLECTÉES:
-- {len(extracted_contents)} pages web extraites avec contenu complet
-- {len(urls_info)} URLs découvertes
-
-CONTENU DES PAGES EXTRAITES:
-{json.dumps(data_for_synthesis, indent=2, ensure_ascii=False)[:15000]}
-
-Ta mission: Créer une synthèse complète et détaillée basée sur ces données.
-
-INSTRUCTIONS:
-1. Analyse TOUT le contenu fourni
-2. Rédige une synthèse de 3-5 paragraphes minimum
-3. Identifie les points clés, initiatives, chiffres importants
-4. Structure l'information de manière logique
-5. Cite les sources pertinentes
-
-Retourne JSON:
-{{
-  "type": "summary",
-  "summary": "Synthèse complète et détaillée (3-5 paragraphes)",
-  "key_points": ["point 1", "point 2", ...],
-  "sources_used": ["url1", "url2", ...],
-  "confidence": "high|medium|low"
-}}
-"""
+            prompt = _SYNTHESIS_SUMMARY_TEMPLATE.substitute(
+                query=query,
+                n_pages=len(extracted_contents),
+                n_urls=len(urls_info),
+                data_json=_jdumps(data_for_synthesis, 15000)
+            )
 
-        response = await self.llm_client.generate(
-            [{"role": "user", "content": prompt}],
-            max_tokens=15000,  # Rapports détaillés 3-5 pages
-            temperature=0.1
-        )
+        try:
+            response = await self._cached_generate(
+                [{"role": "user", "content": prompt}],
+                max_tokens=15000,  # Rapports détaillés 3-5 pages
+                temperature=0.1,
+                stop_at_json=True
+            )
+        except (LLMClientError, TimeoutError) as e:
+            logger.error(f"  ❌ Erreur synthèse: {e}")
+            response = ""
 
         try:
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            synthesis_result = json.loads(response[start_idx:i + 1])
-
-                            # POST-TRAITEMENT: Extraire données structurées du contenu texte si rapport avec sections
-                            logger.info(f"  📋 Synthèse: {len(synthesis_result.get('sections', []))} sections, {len(all_structured_data)} sources données")
-                            if 'sections' in synthesis_result and len(all_structured_data) > 0:
-                                logger.info(f"  🔄 Lancement post-traitement")
-                                synthesis_result = self._post_process_sections(
-                                    synthesis_result,
-                                    all_structured_data
-                                )
-                            else:
-                                logger.warning(f"  ⚠️ Post-traitement ignoré: sections={' sections' in synthesis_result}, data_count={len(all_structured_data)}")
-
-                            return synthesis_result
+            synthesis_result = extract_json(response)
+            if isinstance(synthesis_result, dict):
+                # POST-TRAITEMENT: Extraire données structurées du contenu texte si rapport avec sections
+                logger.info(f"  📋 Synthèse: {len(synthesis_result.get('sections', []))} sections, {len(all_structured_data)} sources données")
+                if 'sections' in synthesis_result and len(all_structured_data) > 0:
+                    logger.info(f"  🔄 Lancement post-traitement")
+                    synthesis_result = self._post_process_sections(
+                        synthesis_result,
+                        all_structured_data
+                    )
+                else:
+                    logger.warning(f"  ⚠️ Post-traitement ignoré: sections={' sections' in synthesis_result}, data_count={len(all_structured_data)}")
+
+                return synthesis_result
         except Exception as e:
             logger.error(f"  ❌ Erreur parsing JSON synthèse: {str(e)}")
             logger.debug(f"  Réponse LLM (200 premiers chars): {response[:200]}")
@@ -1059,7 +1609,13 @@ Retourne JSON:
             "sources_count": len(ctx.datasets)
         }
 
-    def _score_relevance(self, content: str, query: str, structured_data: Optional[Dict] = None) -> float:
+    def _score_relevance(
+        self,
+        content: str,
+        query: str,
+        structured_data: Optional[Dict] = None,
+        query_words: Optional[frozenset] = None
+    ) -> float:
         """
         Score la pertinence d'un chunk de contenu par rapport à la requête.
 
@@ -1067,6 +1623,8 @@ Retourne JSON:
             content: Contenu textuel à scorer
             query: Requête utilisateur
             structured_data: Données structurées extraites (boost le score)
+            query_words: Mots-clés de la requête déjà calculés (évite de les
+                recalculer pour chaque chunk d'une même sélection)
 
         Returns:
             Score de pertinence (0-100)
@@ -1074,14 +1632,23 @@ Retourne JSON:
         if not content:
             return 0.0
 
-        score = 0.0
-        content_lower = content.lower()
-        query_lower = query.lower()
+        # Caractéristiques indépendantes de la requête (longueur, chiffres/dates),
+        # calculées une seule fois par contenu
+        if query_words is None:
+            query_words = self._query_keywords(query)
 
-        # 1. Keyword matching (max 40 points)
-        query_words = set(query_lower.split())
-        query_words = {w for w in query_words if len(w) > 3}  # Mots > 3 chars
+        return self._score_from_features(self._content_features(content), query_words, structured_data)
 
+    @staticmethod
+    def _score_from_features(
+        features: Tuple[str, float],
+        query_words: frozenset,
+        structured_data: Optional[Dict] = None
+    ) -> float:
+        """Score de pertinence (0-100) à partir des caractéristiques d'un contenu."""
+        content_lower, score = features
+
+        # 1. Keyword matching (max 40 points)
         if query_words:
             matched_words = sum(1 for word in query_words if word in content_lower)
             keyword_score = min(40, (matched_words / len(query_words)) * 40)
@@ -1097,6 +1664,39 @@ Retourne JSON:
             struct_score = min(30, (num_count * 3) + (temp_count * 2) + (ent_count * 1))
             score += struct_score
 
+        return min(100.0, score)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _query_keywords(query: str) -> frozenset:
+        """
+        Mots-clés significatifs de la requête (mots > 3 chars).
+
+        Mémoïsé: la même requête est re-sélectionnée pour chaque section et
+        à chaque itération d'enrichissement.
+        """
+        return frozenset(w for w in query.lower().split() if len(w) > 3)
+
+    def _content_features(self, content: str) -> Tuple[str, float]:
+        """
+        Caractéristiques d'un contenu indépendantes de la requête. Seul le score
+        est mis en cache par empreinte du contenu (les mêmes pages sont re-scorées
+        à chaque section); la mise en minuscules, peu coûteuse, est refaite.
+
+        Returns:
+            (contenu en minuscules, score longueur + chiffres/dates sur 30)
+        """
+        key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        static_score = self._content_features_cache.get(key)
+        if static_score is None:
+            static_score = self._compute_static_score(content)
+            self._content_features_cache.set(key, static_score)
+
+        return content.lower(), static_score
+
+    @staticmethod
+    def _compute_static_score(content: str) -> float:
+        """Calcule le score longueur + chiffres/dates (sur 30) sans cache."""
         # 3. Content length quality (max 20 points)
         # Ni trop court (< 500 chars) ni trop long (> 5000 chars)
         content_len = len(content)
@@ -1106,17 +1706,30 @@ Retourne JSON:
             length_score = (content_len / 500) * 20
         else:  # > 5000
             length_score = max(10, 20 - ((content_len - 5000) / 1000))
-        score += length_score
 
         # 4. Presence of numbers/dates (max 10 points)
-        import re
-        numbers = re.findall(r'\d+(?:[.,]\d+)?', content)
-        dates = re.findall(r'\d{4}[-/]\d{2}[-/]\d{2}|\d{2}[-/]\d{2}[-/]\d{4}', content)
+        numbers = _NUM_RE.findall(content)
+        dates = _DATE_RE.findall(content)
 
         data_score = min(10, len(numbers) + len(dates) * 2)
-        score += data_score
 
-        return min(100.0, score)
+        return length_score + data_score
+
+    def _content_features_batch(self, contents: List[str]) -> List[Tuple[str, float]]:
+        """
+        Caractéristiques de plusieurs contenus en une passe: les empreintes sont
+        calculées ensemble et seuls les contenus absents du cache sont analysés.
+        """
+        cache = self._content_features_cache
+        keys = [hashlib.blake2b(c.encode('utf-8', 'surrogatepass'), digest_size=16).digest() for c in contents]
+        static_scores = [cache.get(key) for key in keys]
+
+        for i, cached in enumerate(static_scores):
+            if cached is None:
+                static_scores[i] = self._compute_static_score(contents[i])
+                cache.set(keys[i], static_scores[i])
+
+        return [(content.lower(), score) for content, score in zip(contents, static_scores)]
 
     def _semantic_chunk_selection(
         self,
@@ -1144,62 +1757,55 @@ Retourne JSON:
         Returns:
             Liste triée des chunks les plus pertinents
         """
-        scored_items = []
-
-        for item in all_data:
-            if not isinstance(item, dict):
-                continue
-
-            content = item.get("content", "")
-            if not content:
-                continue
-
-            # Score ce chunk
-            structured_data = item.get("structured_data")
-            score = self._score_relevance(content, query, structured_data)
-
-            scored_items.append({
-                "score": score,
-                "item": item,
-                "content_length": len(content)
-            })
-
-        # Trier par score décroissant
-        scored_items.sort(key=lambda x: x["score"], reverse=True)
-
         # Adapter seuil et stratégie selon profondeur
         if min_score_threshold is None:
             if depth == "light":
                 # Synthèse concise: seulement top sources très pertinentes
                 min_score_threshold = 60.0
-                max_chunks_target = 4  # Peu de sources, qualité maximale
             elif depth == "deep":
                 # Analyse approfondie: exploration large
                 min_score_threshold = 35.0
-                max_chunks_target = 15  # Beaucoup de sources pour vision complète
             else:  # moderate
                 # Équilibré - ABAISSÉ pour permettre plus de données
                 min_score_threshold = 40.0  # Était 55 (trop strict), maintenant 40
-                max_chunks_target = 8  # Était 6, maintenant 8
-        else:
-            max_chunks_target = 20  # Pas de limite si seuil custom
+
+        # Mots-clés de la requête calculés une fois pour toute la sélection
+        query_words = self._query_keywords(query)
+
+        # Listes parallèles (scores, longueurs, items): pas de dict intermédiaire par chunk.
+        # Les contenus identiques ne sont scorés (et retenus) qu'une fois.
+        items: List[Dict] = _dedupe_by_content([
+            item for item in all_data
+            if isinstance(item, dict) and isinstance(item.get("content"), str) and item["content"]
+        ])
+        duplicates = len(all_data) - len(items)
+        contents = [item["content"] for item in items]
+        lengths: List[int] = [len(content) for content in contents]
+
+        # Caractéristiques de tous les chunks calculées en un seul lot avant le scoring
+        features = self._content_features_batch(contents)
+        scores: List[float] = [
+            self._score_from_features(feat, query_words, item.get("structured_data"))
+            for feat, item in zip(features, items)
+        ]
+
+        # Préfiltrer au seuil (les chunks sous le seuil ne sont jamais sélectionnés:
+        # seul le budget max_chars arrête ensuite la sélection), puis tas au lieu d'un tri complet: heapify en O(n) et seuls les chunks
+        # examinés avant l'épuisement du budget sont dépilés (ordre identique au tri,
+        # égalités départagées par position)
+        heap = [(-score, i) for i, score in enumerate(scores) if score >= min_score_threshold]
+        heapq.heapify(heap)
+        order = (heapq.heappop(heap)[1] for _ in range(len(heap)))
 
         # Sélectionner les meilleurs chunks
         selected = []
+        selected_score_sum = 0.0
         total_chars = 0
-        chunks_selected = 0
-
-        for scored in scored_items:
-            # Arrêter si on a atteint le nombre cible ET que le score diminue trop
-            if chunks_selected >= max_chunks_target and scored["score"] < min_score_threshold:
-                break
-
-            # Filtrer les chunks avec score trop faible
-            if scored["score"] < min_score_threshold:
-                continue
 
-            item = scored["item"]
-            content_len = scored["content_length"]
+        for idx in order:
+            score = scores[idx]
+            item = items[idx]
+            content_len = lengths[idx]
 
             # Vérifier si on peut ajouter ce chunk
             if total_chars + content_len > max_chars:
@@ -1207,19 +1813,18 @@ Retourne JSON:
                 if depth == "deep":
                     remaining = max_chars - total_chars
                     if remaining > 1000:  # Au moins 1000 chars disponibles
-                        # Truncate ce chunk pour fit
-                        item_copy = item.copy()
-                        item_copy["content"] = item["content"][:remaining]
-                        selected.append(item_copy)
+                        # Truncate ce chunk pour fit (nouveau dict, l'original reste intact)
+                        selected.append({**item, "content": item["content"][:remaining]})
+                        selected_score_sum += score
                         total_chars += remaining
-                        chunks_selected += 1
                 break
 
             selected.append(item)
+            selected_score_sum += score
             total_chars += content_len
-            chunks_selected += 1
 
-        logger.info(f"  📊 Sélection intelligente: {len(selected)}/{len(all_data)} chunks, {total_chars:,} chars (score moyen: {sum(s['score'] for s in scored_items[:len(selected)]) / max(len(selected), 1):.1f}/100)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"  📊 Sélection intelligente: {len(selected)}/{len(all_data)} chunks, {total_chars:,} chars (score moyen: {selected_score_sum / max(len(selected), 1):.1f}/100, {duplicates} écartés)")
 
         return selected
 
@@ -1231,63 +1836,51 @@ Retourne JSON:
         """
         Post-traite les sections pour extraire les données structurées du texte.
         """
-        import re
-
         logger.info(f"  🔄 POST-TRAITEMENT: Démarrage avec {len(all_structured_data)} sources de données")
 
-        # Agréger toutes les données numériques
-        all_numerical = []
+        # Index des données numériques par (valeur arrondie au centième, unité).
+        # Première occurrence conservée. NaN/Infinity (acceptés par le décodeur
+        # JSON) ignorés: pas de valeur arrondie possible.
+        value_index: Dict[Tuple[int, Optional[str]], Dict] = {}
         for struct_data in all_structured_data:
-            if isinstance(struct_data, dict) and "numerical" in struct_data:
-                all_numerical.extend(struct_data.get("numerical", []))
-
-        # Créer mapping: métrique → données
-        metrics_map = {}
-        for num_data in all_numerical:
-            if isinstance(num_data, dict):
-                metric = num_data.get("metric", "").lower()
-                if metric:
-                    if metric not in metrics_map:
-                        metrics_map[metric] = []
-                    metrics_map[metric].append(num_data)
-
-        # Patterns pour détecter chiffres dans texte
-        number_patterns = [
-            r'(\d+(?:[.,]\d+)?)\s*(%|€|millions?|milliards?|K|M|Md)',
-            r'(\d+(?:[.,]\d+)?)\s+([A-Za-zÀ-ÿ]+)',
-        ]
+            if not isinstance(struct_data, dict):
+                continue
+            for num_data in struct_data.get("numerical", []) or []:
+                if not isinstance(num_data, dict):
+                    continue
+                num_value = num_data.get("value", 0)
+                if not isinstance(num_value, (int, float)) or not num_data.get("metric"):
+                    continue
+                if not math.isfinite(num_value):
+                    continue
+                key = round(num_value * 100)
+                value_index.setdefault((key, num_data.get("unit")), num_data)
+
+        # Patterns pour détecter chiffres dans texte (précompilés au niveau module)
+        number_patterns = (_UNIT_RE, _NUM_WORD_RE)
 
         for section in synthesis_result.get('sections', []):
-            existing_data = section.get('data')
-            if existing_data is not None and len(existing_data) > 0:
+            if section.get('data'):
                 continue  # Déjà rempli par le LLM
 
             content = section.get('content', '')
             section_data = []
 
             for pattern in number_patterns:
-                matches = re.finditer(pattern, content)
+                matches = pattern.finditer(content)
                 for match in matches:
                     try:
                         value_str = match.group(1).replace(',', '.')
                         value = float(value_str)
-                        unit = match.group(2) if len(match.groups()) > 1 else None
+                        unit = match.group(2)
 
                         context_start = max(0, match.start() - 20)
                         context = content[context_start:match.start()].strip()
 
-                        source_url = None
-                        metric_name = None
-
-                        for metric, num_list in metrics_map.items():
-                            for num in num_list:
-                                if abs(num.get("value", 0) - value) < 0.01:
-                                    if num.get("unit") == unit or unit is None:
-                                        source_url = num.get("source_url")
-                                        metric_name = num.get("metric")
-                                        break
-                            if source_url:
-                                break
+                        key = round(value * 100)
+                        hit = value_index.get((key, unit))
+                        source_url = hit.get("source_url") if hit else None
+                        metric_name = hit.get("metric") if hit else None
 
                         section_data.append({
                             "metric": metric_name or "valeur",
@@ -1359,30 +1952,60 @@ Retourne JSON:
 
             logger.info(f"  🎯 {len(weak_sections)} section(s) à enrichir")
 
-            # Enrichir les sections faibles (max 2 par itération)
-            for section_analysis in weak_sections[:2]:
-                section_title = section_analysis.get('title')
-                missing = section_analysis.get('missing', [])
+            # Enrichir les sections faibles (max 2 par itération), en parallèle:
+            # la recherche de l'une recouvre la régénération LLM de l'autre
+            results = await asyncio.gather(
+                *[
+                    self._enrich_one_section(query, section_analysis, report, ctx)
+                    for section_analysis in weak_sections[:2]
+                ],
+                return_exceptions=True
+            )
 
-                logger.info(f"  🔍 Enrichissement: {section_title}")
-                logger.info(f"    Manques: {', '.join(missing)}")
+            # Remplacer les sections dans le rapport (un seul écrivain)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"  ❌ Erreur enrichissement section: {result}")
+                    continue
+                if result is None:
+                    continue
 
-                # Recherche ciblée pour combler les manques
-                enrichment_data = await self._targeted_search(query, section_title, missing, ctx)
+                section_title, updated_section = result
+                for i, section in enumerate(report.get('sections', [])):
+                    if section.get('title') == section_title:
+                        report['sections'][i] = updated_section
+                        break
 
-                # Régénérer la section avec les nouvelles données
-                if enrichment_data:
-                    updated_section = await self._regenerate_section(
-                        query, section_title, report, enrichment_data, ctx
-                    )
+        return report
 
-                    # Remplacer la section dans le rapport
-                    for i, section in enumerate(report.get('sections', [])):
-                        if section.get('title') == section_title:
-                            report['sections'][i] = updated_section
-                            break
+    async def _enrich_one_section(
+        self,
+        query: str,
+        section_analysis: Dict[str, Any],
+        report: Dict[str, Any],
+        ctx: ExecutionContext
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Enrichit une section faible: recherche ciblée puis régénération.
 
-        return report
+        Ne modifie pas le rapport. Retourne (titre, section régénérée) ou None.
+        """
+        section_title = section_analysis.get('title')
+        missing = section_analysis.get('missing', [])
+
+        logger.info(f"  🔍 Enrichissement: {section_title}")
+        logger.info(f"    Manques: {', '.join(missing)}")
+
+        # Recherche ciblée pour combler les manques
+        enrichment_data = await self._targeted_search(query, section_title, missing, ctx)
+        if not enrichment_data:
+            return None
+
+        # Régénérer la section avec les nouvelles données
+        updated_section = await self._regenerate_section(
+            query, section_title, report, enrichment_data, ctx
+        )
+        return section_title, updated_section
 
     async def _analyze_report_quality(
         self,
@@ -1439,23 +2062,17 @@ CRITÈRES:
 """
 
         try:
-            response = await self.llm_client.generate(
+            response = await self._cached_generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=2000,
-                temperature=0.1
+                temperature=0.1,
+                stop_at_json=True
             )
 
             # Parser JSON
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            return json.loads(response[start_idx:i + 1])
+            quality = extract_json(response)
+            if isinstance(quality, dict):
+                return quality
         except Exception as e:
             logger.error(f"Erreur analyse qualité: {e}")
 
@@ -1482,7 +2099,7 @@ CRITÈRES:
 
         try:
             # Recherche SearXNG
-            results = await searxng_client.search(search_query, max_results=5)
+            results = await self._cached_search(search_query, max_results=5, ctx=ctx)
 
             if not results:
                 return None
@@ -1490,39 +2107,16 @@ CRITÈRES:
             # Extraire les 2 premiers résultats les plus pertinents
             urls_to_extract = [r.url for r in results[:2]]
 
-            extracted_data = []
-            for url in urls_to_extract:
-                try:
-                    extract_result = await self.extractor_manager.extract(
-                        url=url,
-                        llm_client=self.llm_client,
-                        options=ExtractionOptions(
-                            timeout=30,
-                            use_agent=False,
-                            headless=True
-                        )
-                    )
-
-                    if extract_result.success and extract_result.content:
-                        # Extraction données structurées (enrichissement ciblé)
-                        structured = await self.data_extractor.extract_structured_data(
-                            content=extract_result.content[:2000],
-                            source_url=url,
-                            topic_context=f"{query} - {section_title}"
-                        )
+            # Extraction + données structurées par URL, URLs traitées en parallèle
+            topic_context = f"{query} - {section_title}"
+            pages = await asyncio.gather(
+                *(self._extract_targeted_page(url, topic_context) for url in urls_to_extract)
+            )
 
-                        extracted_data.append({
-                            "url": url,
-                            "title": extract_result.title or "",
-                            "content": extract_result.content[:2000],
-                            "structured_data": structured.to_dict()
-                        })
-                        # Ajouter aux sources découvertes (avec déduplication)
-                        if url not in ctx.discovered_sources:
-                            ctx.discovered_sources.append(url)
-                except Exception as e:
-                    logger.warning(f"    ⚠️ Échec extraction {url}: {e}")
-                    continue
+            extracted_data = [page for page in pages if page is not None]
+            for page in extracted_data:
+                # Ajouter aux sources découvertes (avec déduplication)
+                ctx.add_discovered_source(page["url"])
 
             return {
                 "query": search_query,
@@ -1534,6 +2128,33 @@ CRITÈRES:
             logger.error(f"Erreur recherche ciblée: {e}")
             return None
 
+    async def _extract_targeted_page(self, url: str, topic_context: str) -> Optional[Dict[str, Any]]:
+        """
+        Extrait une page (tronquée à 2000 chars) et ses données structurées
+        pour l'enrichissement ciblé. Retourne None en cas d'échec.
+        """
+        page = await self._extract_one(url, _DEFAULT_EXTRACT_OPTS)
+        if not page or not page["content"]:
+            return None
+
+        content = page["content"][:2000]
+        try:
+            structured = await self.data_extractor.extract_structured_data(
+                content=content,
+                source_url=url,
+                topic_context=topic_context
+            )
+        except Exception as e:
+            logger.warning(f"    ⚠️ Échec extraction {url}: {e}")
+            return None
+
+        return {
+            "url": url,
+            "title": page["title"],
+            "content": content,
+            "structured_data": structured.to_dict()
+        }
+
     async def _regenerate_section(
         self,
         query: str,
@@ -1555,11 +2176,7 @@ CRITÈRES:
             return None
 
         # Données d'enrichissement
-        enrichment_content = json.dumps(
-            enrichment_data.get('sources', []),
-            indent=2,
-            ensure_ascii=False
-        )[:3000]
+        enrichment_content = _jdumps(enrichment_data.get('sources', []), 3000)
 
         prompt = f"""Améliore cette section de rapport avec les nouvelles données collectées:
 
@@ -1592,25 +2209,17 @@ IMPORTANT: Le contenu doit être PLUS détaillé et factuel que l'original.
 """
 
         try:
-            response = await self.llm_client.generate(
+            response = await self._cached_generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=2000,
                 temperature=0.1
             )
 
             # Parser JSON
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            result = json.loads(response[start_idx:i + 1])
-                            logger.info(f"    ✅ Section enrichie: {section_title}")
-                            return result
+            result = extract_json(response)
+            if isinstance(result, dict):
+                logger.info(f"    ✅ Section enrichie: {section_title}")
+                return result
         except Exception as e:
             logger.error(f"Erreur régénération section: {e}")
 
@@ -1620,15 +2229,32 @@ IMPORTANT: Le contenu doit être PLUS détaillé et factuel que l'original.
     async def _validate_numerical_coherence(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Valide la cohérence des chiffres mentionnés dans le rapport."""
 
+        # Texte soumis au LLM (8000 premiers caractères): construit section par section
+        # dans la limite du budget, sans matérialiser le rapport complet
+        budget = 8000
         sections_text = []
         for section in report.get('sections', []):
-            sections_text.append(f"## {section.get('title')}\n{section.get('content', '')}")
-
-        full_text = "\n\n".join(sections_text)
+            if budget <= 0:
+                break
+            block = f"## {section.get('title')}\n{section.get('content', '')}"[:budget]
+            sections_text.append(block)
+            budget -= len(block) + 2  # séparateur "\n\n"
+
+        full_text = "\n\n".join(sections_text)[:8000]
+
+        # Pré-filtrage local: sans au moins deux montants, aucune incohérence possible
+        amounts_found = sum(1 for _ in itertools.islice(_AMOUNT_RE.finditer(full_text), 2))
+        if amounts_found < 2:
+            logger.info("✓ Cohérence numérique: pas assez de chiffres, validation LLM ignorée")
+            report['validation'] = {
+                'numerical_coherence_checked': False,
+                'coherent': True
+            }
+            return report
 
         prompt = f"""Analyse la cohérence numérique de ce rapport:
 
-{full_text[:8000]}
+{full_text}
 
 Ta mission:
 1. Extraire TOUS les chiffres mentionnés (montants, pourcentages, dates, quantités)
@@ -1665,50 +2291,41 @@ RÈGLES:
 """
 
         try:
-            response = await self.llm_client.generate(
+            response = await self._cached_generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=1500,
                 temperature=0.1
             )
 
             # Parser JSON
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            validation = json.loads(response[start_idx:i + 1])
-
-                            # Logger les problèmes trouvés
-                            if not validation.get('coherent', True):
-                                high_severity_issues = [
-                                    issue for issue in validation.get('issues', [])
-                                    if issue.get('severity') == 'high'
-                                ]
-                                if high_severity_issues:
-                                    logger.warning(f"⚠️ {len(high_severity_issues)} incohérence(s) numérique(s) détectée(s)")
-                                    for issue in high_severity_issues:
-                                        logger.warning(f"  - {issue.get('description')}")
-                                        logger.info(f"    Correction suggérée: {issue.get('suggested_fix')}")
-
-                                # Ajouter une note de validation au rapport
-                                report['validation'] = {
-                                    'numerical_coherence_checked': True,
-                                    'issues_found': len(validation.get('issues', [])),
-                                    'high_severity_issues': len(high_severity_issues)
-                                }
-                            else:
-                                logger.info("✓ Cohérence numérique validée")
-                                report['validation'] = {
-                                    'numerical_coherence_checked': True,
-                                    'coherent': True
-                                }
-
-                            return report
+            validation = extract_json(response)
+            if isinstance(validation, dict):
+                # Logger les problèmes trouvés
+                if not validation.get('coherent', True):
+                    high_severity_issues = [
+                        issue for issue in validation.get('issues', [])
+                        if issue.get('severity') == 'high'
+                    ]
+                    if high_severity_issues:
+                        logger.warning(f"⚠️ {len(high_severity_issues)} incohérence(s) numérique(s) détectée(s)")
+                        for issue in high_severity_issues:
+                            logger.warning(f"  - {issue.get('description')}")
+                            logger.info(f"    Correction suggérée: {issue.get('suggested_fix')}")
+
+                    # Ajouter une note de validation au rapport
+                    report['validation'] = {
+                        'numerical_coherence_checked': True,
+                        'issues_found': len(validation.get('issues', [])),
+                        'high_severity_issues': len(high_severity_issues)
+                    }
+                else:
+                    logger.info("✓ Cohérence numérique validée")
+                    report['validation'] = {
+                        'numerical_coherence_checked': True,
+                        'coherent': True
+                    }
+
+                return report
         except Exception as e:
             logger.error(f"Erreur validation cohérence: {e}")
 
@@ -1725,65 +2342,136 @@ RÈGLES:
     # Phase 5: Comblement des manques
     # ===================================================================
 
-    async def _synthesize_sections(self, query: str, ctx: ExecutionContext) -> Dict[str, Any]:
+    async def _synthesize_sections(
+        self,
+        query: str,
+        ctx: ExecutionContext,
+        section_names: Optional[set] = None
+    ) -> Dict[str, Any]:
         """
         PHASE 3: Synthèse par section.
         Pour chaque section, synthétise les données brutes collectées en contenu rédigé.
+
+        Args:
+            section_names: Sections à (re)synthétiser (toutes si None)
         """
-        logger.info(f"📝 PHASE 3: Synthèse par section ({len(ctx.final_content['sections'])} sections)")
+        sections = ctx.final_content['sections']
+        logger.info(f"📝 PHASE 3: Synthèse par section ({len(section_names or sections)} sections)")
+
+        # Sections indépendantes: appels LLM en parallèle (bornés), puis
+        # application des résultats en une seconde passe (un seul écrivain)
+        semaphore = asyncio.Semaphore(self.max_parallel_sections)
+        pending = []
+        for section_name, section_data in sections.items():
+            if section_names is not None and section_name not in section_names:
+                continue
+            if not section_data.raw_data:
+                logger.warning(f"  ⚠️ Section '{section_name}': aucune donnée")
+                continue
+            pending.append((section_name, section_data))
 
-        for section_name, section_data in ctx.final_content['sections'].items():
-            raw_data = section_data['raw_data']
+        results = await asyncio.gather(
+            *(self._synthesize_one_section(query, name, data.raw_data, semaphore) for name, data in pending),
+            return_exceptions=True
+        )
 
-            if not raw_data:
-                logger.warning(f"  ⚠️ Section '{section_name}': aucune donnée")
+        for (section_name, section_data), section_result in zip(pending, results):
+            if isinstance(section_result, Exception):
+                logger.error(f"  ❌ Erreur synthèse section '{section_name}': {section_result}")
+                continue
+            if section_result is None:
                 continue
 
-            logger.info(f"  🔄 Synthèse section: {section_name} ({len(raw_data)} données)")
+            # Mettre à jour la section dans le contexte
+            content = section_result.get('content', '')
+            section_data.set_content(content)
+            section_data.key_data = section_result.get('key_data', [])
+            section_data.sources = section_result.get('sources_used', [])
+            ctx.sections_dirty.add(section_name)
+
+            logger.info(f"    ✓ Section synthétisée: {len(content)} chars")
+
+        return ctx.final_content
+
+    async def _synthesize_one_section(
+        self,
+        query: str,
+        section_name: str,
+        raw_data: List[Dict],
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Synthétise une section à partir de ses données brutes (appel LLM borné
+        par le sémaphore).
+
+        Returns:
+            Résultat JSON de la synthèse (content, key_data, sources_used) ou None
+        """
+        logger.info(f"  🔄 Synthèse section: {section_name} ({len(raw_data)} données)")
+
+        # Déterminer la profondeur d'analyse pour cette section
+        # TODO: Extraire du plan généré en Phase 1 section_targets
+        # Pour l'instant, utiliser moderate par défaut
+        section_depth = "moderate"
+
+        # Sélection intelligente des données pertinentes pour cette section
+        selected_data = self._semantic_chunk_selection(raw_data, query, max_chars=20000, depth=section_depth)
+
+        # Préparation du prompt de synthèse: pages sérialisées une à une, sans doublon
+        # d'URL, ajoutées par pertinence décroissante tant que le budget (25000 chars)
+        # le permet, au lieu de tronquer le JSON en plein milieu d'une page
+        payload_budget = 25000
+        data_parts: List[str] = []
+        seen_urls = set()
+        # Compteurs de données structurées accumulés pendant la préparation (une seule passe)
+        n_numerical = n_temporal = n_entities = 0
 
-            # Déterminer la profondeur d'analyse pour cette section
-            # TODO: Extraire du plan généré en Phase 1 section_targets
-            # Pour l'instant, utiliser moderate par défaut
-            section_depth = "moderate"
+        for item in selected_data:
+            if not isinstance(item, dict) or not item.get("content"):
+                continue
 
-            # Sélection intelligente des données pertinentes pour cette section
-            selected_data = self._semantic_chunk_selection(raw_data, query, max_chars=20000, depth=section_depth)
+            url = item.get("url", "")
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
 
-            # Préparation du prompt de synthèse
-            data_for_synthesis = []
-            all_structured_data = []
+            page_data = {
+                "url": url,
+                "title": item.get("title", ""),
+                "content": item.get("content", "")
+            }
 
-            for item in selected_data:
-                if isinstance(item, dict):
-                    if "content" in item and item.get("content"):
-                        page_data = {
-                            "url": item.get("url", ""),
-                            "title": item.get("title", ""),
-                            "content": item.get("content", "")
-                        }
+            # Ajouter données structurées
+            struct = item.get("structured_data")
+            if struct:
+                page_data["numerical_data"] = struct.get("numerical", [])
+                page_data["temporal_data"] = struct.get("temporal", [])
+                page_data["entities"] = struct.get("entities", [])
 
-                        # Ajouter données structurées
-                        if "structured_data" in item and item["structured_data"]:
-                            struct = item["structured_data"]
-                            page_data["numerical_data"] = struct.get("numerical", [])
-                            page_data["temporal_data"] = struct.get("temporal", [])
-                            page_data["entities"] = struct.get("entities", [])
-                            all_structured_data.append(struct)
+            page_json = _jdumps(page_data, indent=False)
+            if data_parts and len(page_json) + 1 > payload_budget:
+                break
+            data_parts.append(page_json)
+            payload_budget -= len(page_json) + 1
 
-                        data_for_synthesis.append(page_data)
+            if struct:
+                n_numerical += len(page_data["numerical_data"])
+                n_temporal += len(page_data["temporal_data"])
+                n_entities += len(page_data["entities"])
 
-            # Appel LLM pour synthétiser cette section
-            # APPROCHE QUALITATIVE: adapter les instructions selon la profondeur, pas imposer longueur arbitraire
-            if section_depth == "light":
-                synthesis_instructions = """Ta mission: Synthèse CONCISE des points clés uniquement.
+        # Appel LLM pour synthétiser cette section
+        # APPROCHE QUALITATIVE: adapter les instructions selon la profondeur, pas imposer longueur arbitraire
+        if section_depth == "light":
+            synthesis_instructions = """Ta mission: Synthèse CONCISE des points clés uniquement.
 
 INSTRUCTIONS:
 1. Identifie les 3-5 informations les plus importantes
 2. Rédige 2-3 paragraphes courts et précis
 3. Va droit à l'essentiel, sans détails secondaires
 4. Cite les sources principales"""
-            elif section_depth == "deep":
-                synthesis_instructions = """Ta mission: Analyse APPROFONDIE explorant tous les aspects.
+        elif section_depth == "deep":
+            synthesis_instructions = """Ta mission: Analyse APPROFONDIE explorant tous les aspects.
 
 INSTRUCTIONS:
 1. Analyse TOUTES les données fournies en profondeur
@@ -1792,8 +2480,8 @@ INSTRUCTIONS:
 4. Développe les nuances et contextes
 5. Compare les sources et perspectives
 6. Cite systématiquement toutes les sources"""
-            else:  # moderate
-                synthesis_instructions = """Ta mission: Rédiger un contenu ÉQUILIBRÉ et informatif.
+        else:  # moderate
+            synthesis_instructions = """Ta mission: Rédiger un contenu ÉQUILIBRÉ et informatif.
 
 INSTRUCTIONS:
 1. Analyse les données principales
@@ -1801,17 +2489,17 @@ INSTRUCTIONS:
 3. Équilibre profondeur et clarté
 4. Cite les sources importantes"""
 
-            prompt = f"""Synthétise le contenu pour la section "{section_name}" du rapport.
+        prompt = f"""Synthétise le contenu pour la section "{section_name}" du rapport.
 
 REQUÊTE INITIALE: "{query}"
 
-DONNÉES DISPONIBLES ({len(data_for_synthesis)} sources):
-{json.dumps(data_for_synthesis, indent=2, ensure_ascii=False)[:25000]}
+DONNÉES DISPONIBLES ({len(data_parts)} sources):
+[{",".join(data_parts)}]
 
 DONNÉES STRUCTURÉES EXTRAITES:
-- {sum(len(s.get('numerical', [])) for s in all_structured_data)} données numériques
-- {sum(len(s.get('temporal', [])) for s in all_structured_data)} données temporelles
-- {sum(len(s.get('entities', [])) for s in all_structured_data)} entités
+- {n_numerical} données numériques
+- {n_temporal} données temporelles
+- {n_entities} entités
 
 {synthesis_instructions}
 
@@ -1835,36 +2523,15 @@ RAPPEL: Chaque affirmation factuelle DOIT avoir [SOURCE:url]. Les sources_used d
 
 Rédige maintenant pour "{section_name}":"""
 
-            response = await self.llm_client.generate(
+        async with semaphore:
+            response = await self._cached_generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=5000,
-                temperature=0.3
-            )
-
-            # Parser JSON
-            try:
-                start_idx = response.find('{')
-                if start_idx != -1:
-                    bracket_depth = 0
-                    for i, char in enumerate(response[start_idx:], start=start_idx):
-                        if char == '{':
-                            bracket_depth += 1
-                        elif char == '}':
-                            bracket_depth -= 1
-                            if bracket_depth == 0:
-                                section_result = json.loads(response[start_idx:i + 1])
-
-                                # Mettre à jour la section dans le contexte
-                                ctx.final_content['sections'][section_name]['content'] = section_result.get('content', '')
-                                ctx.final_content['sections'][section_name]['metadata']['key_data'] = section_result.get('key_data', [])
-                                ctx.final_content['sections'][section_name]['metadata']['sources'] = section_result.get('sources_used', [])
-
-                                logger.info(f"    ✓ Section synthétisée: {len(section_result.get('content', ''))} chars")
-                                break
-            except Exception as e:
-                logger.error(f"  ❌ Erreur synthèse section '{section_name}': {e}")
+                temperature=0.3
+            )
 
-        return ctx.final_content
+        section_result = extract_json(response)
+        return section_result if isinstance(section_result, dict) else None
 
     async def _assemble_and_evaluate(self, query: str, ctx: ExecutionContext) -> Dict[str, Any]:
         """
@@ -1873,14 +2540,20 @@ Rédige maintenant pour "{section_name}":"""
         """
         logger.info("🔗 PHASE 4: Assemblage global et évaluation")
 
+        # Aucune section modifiée depuis le dernier assemblage: rien à ré-assembler
+        if not ctx.sections_dirty and ctx.last_assembled is not None:
+            logger.info("  ♻️ Sections inchangées, rapport assemblé réutilisé")
+            # Copie: l'appelant peut modifier le rapport (bibliographie) sans altérer le cache
+            return copy.deepcopy(ctx.last_assembled)
+
         # Préparer les sections pour l'assemblage
         sections_content = []
         for section_name, section_data in ctx.final_content['sections'].items():
-            if section_data['content']:
+            if section_data.content:
                 sections_content.append({
                     "title": section_name,
-                    "content": section_data['content'],
-                    "data": section_data['metadata'].get('key_data', [])
+                    "content": section_data.content,
+                    "data": section_data.key_data
                 })
 
         if not sections_content:
@@ -1895,7 +2568,7 @@ Rédige maintenant pour "{section_name}":"""
 REQUÊTE: "{query}"
 
 SECTIONS DISPONIBLES ({len(sections_content)}):
-{json.dumps(sections_content, indent=2, ensure_ascii=False)[:30000]}
+{_jdumps(sections_content, 30000, indent=False)}
 
 Ta mission:
 1. Vérifier cohérence entre sections
@@ -1927,26 +2600,25 @@ Retourne JSON:
   }}
 }}"""
 
-        response = await self.llm_client.generate(
-            [{"role": "user", "content": prompt}],
-            max_tokens=10000,
-            temperature=0.2
-        )
+        try:
+            response = await self._cached_generate(
+                [{"role": "user", "content": prompt}],
+                max_tokens=10000,
+                temperature=0.2,
+                stop_at_json=True  # Rapport complet dès la fermeture du JSON
+            )
+        except (LLMClientError, TimeoutError) as e:
+            logger.error(f"  ❌ Erreur assemblage: {e}")
+            response = ""
 
         # Parser JSON
         try:
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            final_report = json.loads(response[start_idx:i + 1])
-                            logger.info(f"  ✓ Rapport assemblé: {len(final_report.get('sections', []))} sections")
-                            return final_report
+            final_report = extract_json(response)
+            if isinstance(final_report, dict):
+                logger.info(f"  ✓ Rapport assemblé: {len(final_report.get('sections', []))} sections")
+                ctx.sections_dirty.clear()
+                ctx.last_assembled = copy.deepcopy(final_report)
+                return final_report
         except Exception as e:
             logger.error(f"  ❌ Erreur assemblage: {e}")
 
@@ -1965,33 +2637,35 @@ Retourne JSON:
         AMÉLIORATION: Inclut aussi TOUTES les sources des données structurées,
         même si elles ne sont pas citées explicitement dans le texte.
         """
-        import re
-
         # Collecter toutes les URLs uniques citées dans le rapport
         url_to_num = {}
         bibliography = []
         counter = 1
+        today_str = datetime.now().strftime("%Y-%m-%d")
+
+        def number_citation(match: re.Match) -> str:
+            """Numérote une URL citée à sa première occurrence et renvoie la référence."""
+            nonlocal counter
+            url = match.group(1)
+            num = url_to_num.get(url)
+            if num is None:
+                num = url_to_num[url] = counter
+                # Extraire le domaine pour le titre
+                domain = urlsplit(url).netloc or url
+                bibliography.append({
+                    "id": counter,
+                    "url": url,
+                    "title": f"Source {counter} - {domain}",
+                    "accessed": today_str
+                })
+                counter += 1
+            return f'[{num}]'
 
-        # ÉTAPE 1: Collecter les URLs citées dans le contenu avec [SOURCE:url]
+        # ÉTAPE 1: Numéroter les URLs citées [SOURCE:url] et les remplacer par [numéro]
+        # en un seul passage par section (collecte et substitution simultanées)
         for section in report.get('sections', []):
             content = section.get('content', '')
-
-            # Trouver toutes les citations [SOURCE:url]
-            pattern = r'\[SOURCE:(https?://[^\]]+)\]'
-            matches = re.findall(pattern, content)
-
-            for url in matches:
-                if url not in url_to_num:
-                    url_to_num[url] = counter
-                    # Extraire le domaine pour le titre
-                    domain = url.split('/')[2] if len(url.split('/')) > 2 else url
-                    bibliography.append({
-                        "id": counter,
-                        "url": url,
-                        "title": f"Source {counter} - {domain}",
-                        "accessed": datetime.now().strftime("%Y-%m-%d")
-                    })
-                    counter += 1
+            section['content'] = _SOURCE_CITATION_RE.sub(number_citation, content)
 
         # ÉTAPE 2: Ajouter les sources des données structurées (métriques, etc.)
         # Ces sources ont été utilisées même si non citées explicitement dans le texte
@@ -2001,25 +2675,15 @@ Retourne JSON:
                 source_url = data_point.get('source')
                 if source_url and source_url not in url_to_num:
                     url_to_num[source_url] = counter
-                    domain = source_url.split('/')[2] if len(source_url.split('/')) > 2 else source_url
+                    domain = urlsplit(source_url).netloc or source_url
                     bibliography.append({
                         "id": counter,
                         "url": source_url,
                         "title": f"Source {counter} - {domain}",
-                        "accessed": datetime.now().strftime("%Y-%m-%d")
+                        "accessed": today_str
                     })
                     counter += 1
 
-        # Remplacer [SOURCE:url] par [numéro] dans toutes les sections
-        for section in report.get('sections', []):
-            content = section.get('content', '')
-
-            # Remplacer chaque citation par son numéro
-            for url, num in url_to_num.items():
-                content = content.replace(f'[SOURCE:{url}]', f'[{num}]')
-
-            section['content'] = content
-
         # Ajouter la bibliographie au rapport
         report['bibliography'] = bibliography
 
@@ -2027,38 +2691,53 @@ Retourne JSON:
 
         return report
 
-    def _identify_gaps(self, report: Dict[str, Any], ctx: ExecutionContext) -> List[Dict[str, Any]]:
+    def _identify_gaps(
+        self,
+        report: Dict[str, Any],
+        ctx: ExecutionContext,
+        stop_after_high: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Identifie les manques dans le rapport SANS appel LLM.
         Utilise des heuristiques simples.
+
+        Args:
+            stop_after_high: Arrêter l'analyse dès que ce nombre de manques
+                prioritaires ("high") est atteint (analyse complète si None)
         """
         gaps = []
+        high_count = 0
 
         for section in report.get('sections', []):
             section_title = section.get('title', '')
             content = section.get('content', '')
-            data = section.get('data', [])
+            content_len = len(content)
+            data_len = len(section.get('data') or [])
 
             # Critère 1: Section trop courte
-            if len(content) < 1500:
+            if content_len < 1500:
                 gaps.append({
                     "section": section_title,
                     "type": "content_too_short",
-                    "description": f"Section courte: {len(content)} chars",
-                    "priority": "high" if len(content) < 800 else "medium"
+                    "description": f"Section courte: {content_len} chars",
+                    "priority": "high" if content_len < 800 else "medium"
                 })
+                if content_len < 800:
+                    high_count += 1
+                    if stop_after_high is not None and high_count >= stop_after_high:
+                        break
 
             # Critère 2: Pas assez de données structurées
-            if len(data) < 2:
+            if data_len < 2:
                 gaps.append({
                     "section": section_title,
                     "type": "missing_data",
-                    "description": f"Peu de données: {len(data)} métriques",
+                    "description": f"Peu de données: {data_len} métriques",
                     "priority": "medium"
                 })
 
-            # Critère 3: Pas de sources citées
-            if "http" not in content and "www" not in content:
+            # Critère 3: Pas de sources citées (un seul passage sur le texte)
+            if _URL_HINT_RE.search(content) is None:
                 gaps.append({
                     "section": section_title,
                     "type": "missing_sources",
@@ -2066,9 +2745,10 @@ Retourne JSON:
                     "priority": "low"
                 })
 
-        logger.info(f"  📊 Manques identifiés: {len(gaps)}")
-        for gap in gaps:
-            logger.info(f"    - {gap['section']}: {gap['description']} ({gap['priority']})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"  📊 Manques identifiés: {len(gaps)}")
+            for gap in gaps:
+                logger.info(f"    - {gap['section']}: {gap['description']} ({gap['priority']})")
 
         return gaps
 
@@ -2099,6 +2779,7 @@ Retourne JSON:
             logger.info(f"  🔄 Itération {iteration + 1}/{max_iterations}")
 
             # Traiter les 2 premiers gaps prioritaires
+            enriched_sections = set()
             for gap in high_priority_gaps[:2]:
                 section_name = gap['section']
                 gap_type = gap['type']
@@ -2110,26 +2791,30 @@ Retourne JSON:
                 enrichment_data = await self._targeted_search(
                     query=query,
                     section_title=section_name,
-                    missing_aspects=[gap_type],
+                    missing=[gap_type],
                     ctx=ctx
                 )
 
-                if enrichment_data:
+                if enrichment_data and enrichment_data.get('sources'):
                     # Ajouter aux raw_data de la section
                     if section_name in ctx.final_content['sections']:
-                        ctx.final_content['sections'][section_name]['raw_data'].extend(enrichment_data)
+                        ctx.add_section_data(section_name, enrichment_data['sources'])
+                        enriched_sections.add(section_name)
 
-            # Re-synthèse des sections modifiées
-            await self._synthesize_sections(query, ctx)
+            # Re-synthèse des seules sections enrichies (les autres restent valides)
+            if enriched_sections:
+                await self._synthesize_sections(query, ctx, section_names=enriched_sections)
 
             # Re-assemblage
             report = await self._assemble_and_evaluate(query, ctx)
 
-            # Re-évaluation des gaps
-            new_gaps = self._identify_gaps(report, ctx)
-            if len(new_gaps) < len(high_priority_gaps):
-                logger.info(f"  ✓ Progrès: {len(high_priority_gaps)} → {len(new_gaps)} manques")
-                high_priority_gaps = [g for g in new_gaps if g['priority'] == 'high']
+            # Re-évaluation des gaps: seuls les manques prioritaires comptent, l'analyse
+            # s'arrête dès qu'on en retrouve autant qu'avant (aucun progrès possible)
+            new_gaps = self._identify_gaps(report, ctx, stop_after_high=len(high_priority_gaps))
+            new_high_gaps = [g for g in new_gaps if g['priority'] == 'high']
+            if len(new_high_gaps) < len(high_priority_gaps):
+                logger.info(f"  ✓ Progrès: {len(high_priority_gaps)} → {len(new_high_gaps)} manques prioritaires")
+                high_priority_gaps = new_high_gaps
                 if not high_priority_gaps:
                     break
             else:
@@ -2142,7 +2827,12 @@ Retourne JSON:
     # NOUVELLES MÉTHODES POUR ARCHITECTURE REFONDÉE
     # ========================================================================
 
-    async def _exploratory_phase(self, query: str, context: Dict) -> Dict[str, Any]:
+    async def _exploratory_phase(
+        self,
+        query: str,
+        context: Dict,
+        ctx: Optional[ExecutionContext] = None
+    ) -> Dict[str, Any]:
         """
         PHASE 1.1: Exploration initiale restreinte pour évaluer le champ.
 
@@ -2166,9 +2856,10 @@ Retourne JSON:
         }
 
         try:
-            search_results = await searxng_client.search(
+            search_results = await self._cached_search(
                 query=search_params["query"],
-                max_results=search_params["max_results"]
+                max_results=search_params["max_results"],
+                ctx=ctx
             )
 
             urls_found = []
@@ -2212,20 +2903,17 @@ Retourne JSON:
 
     def _extract_topics_from_snippets(self, urls_data: List[Dict]) -> List[str]:
         """Extrait les sous-thèmes des snippets de recherche."""
-        # Analyse simple par mots-clés fréquents
-        from collections import Counter
-        import re
-
-        words = []
+        # Analyse simple par mots-clés fréquents (mots de 4+ lettres hors stopwords),
+        # comptés à la volée sans liste intermédiaire
+        counts = Counter()
         for url_data in urls_data:
-            text = f"{url_data.get('title', '')} {url_data.get('snippet', '')}"
-            # Extraire mots de 4+ lettres
-            words.extend(re.findall(r'\b[a-zA-Z]{4,}\b', text.lower()))
+            text = f"{url_data.get('title', '')} {url_data.get('snippet', '')}".lower()
+            counts.update(
+                word for word in _TOPIC_WORD_RE.findall(text)
+                if word not in _TOPIC_STOPWORDS
+            )
 
-        # Mots les plus fréquents (hors stopwords basiques)
-        stopwords = {'this', 'that', 'with', 'from', 'have', 'more', 'will', 'your', 'about', 'what', 'when', 'where', 'which', 'their', 'there'}
-        filtered = [w for w in words if w not in stopwords]
-        common = Counter(filtered).most_common(5)
+        common = counts.most_common(5)
 
         return [word for word, count in common if count >= 2]
 
@@ -2251,9 +2939,7 @@ Retourne JSON:
         field_richness = exploration_data.get("field_assessment", "moderate")
         sources_count = len(exploration_data.get("sources", []))
 
-        prompt = f"""Tu es un planificateur expert. Crée un plan détaillé pour répondre à cette requête.
-
-REQUÊTE: "{query}"
+        prompt = f"""REQUÊTE: "{query}"
 
 DONNÉES D'EXPLORATION:
 - Sources découvertes: {sources_count}
@@ -2262,134 +2948,30 @@ DONNÉES D'EXPLORATION:
 - Aperçu: {exploration_data.get('data_preview', {}).get('snippets', [])[0][:150] if exploration_data.get('data_preview', {}).get('snippets') else 'N/A'}
 
 CONTEXTE UTILISATEUR:
-{json.dumps(context, indent=2) if context else "Aucun"}
-
-Ta mission: Créer un CANVAS DÉTAILLÉ avec structure complète et enchaînements.
-
-ÉTAPE 1: ANALYSE MULTI-CRITÈRES
-Évalue la complexité nécessaire (1-5 pour chaque critère):
-
-1. **Complexité du sujet**: Simple (1) → Multidimensionnel (5)
-2. **Spécificité demandée**: Large (1) → Très précis (5)
-3. **Format**: Résumé (1) → Étude approfondie (5)
-4. **Profondeur temporelle**: Point dans le temps (1) → Évolution + projection (5)
-5. **Interconnexions**: Sujet isolé (1) → Analyse systémique (5)
-
-Score moyen = profondeur globale
-
-ÉTAPE 2: DÉTERMINER AMPLEUR ET STRUCTURE
-
-Selon score_profondeur:
-- 1.0-2.0: Rapport CONCIS (1-2 sections, 500-1000 mots)
-- 2.1-3.0: Rapport STANDARD (2-3 sections, 1000-1500 mots)
-- 3.1-4.0: Rapport DÉTAILLÉ (3-5 sections, 1500-2500 mots)
-- 4.1-5.0: Étude APPROFONDIE (4-7 sections, 2500-4000 mots)
-
-ÉTAPE 3: DÉFINIR ENCHAÎNEMENTS NARRATIFS
-
-Pour chaque transition entre sections, définis:
-- Lien logique (pourquoi cette section après la précédente)
-- Type de transition (cause-effet, chronologique, zoom-in, comparaison, etc.)
-
-Retourne JSON:
-{{
-  "complexity_analysis": {{
-    "topic_complexity": 1-5,
-    "specificity": 1-5,
-    "format_depth": 1-5,
-    "temporal_depth": 1-5,
-    "interconnections": 1-5,
-    "overall_score": moyenne,
-    "target_length": "concis|standard|détaillé|approfondi",
-    "estimated_words": nombre_total,
-    "justification": "Pourquoi ce niveau"
-  }},
-
-  "sections": ["Titre Section 1", "Titre Section 2", ...],
-
-  "section_targets": {{
-    "Titre Section 1": {{
-      "words_target": nombre,
-      "depth": "light|moderate|deep",
-      "objectives": ["objectif 1", "objectif 2"],
-      "key_questions": ["question à explorer 1", "question 2"]
-    }},
-    ...
-  }},
-
-  "narrative_flow": [
-    {{
-      "from_section": "Section 1",
-      "to_section": "Section 2",
-      "transition_type": "zoom-in|cause-effect|chronological|comparison",
-      "rationale": "Pourquoi cet enchaînement"
-    }},
-    ...
-  ],
-
-  "search_strategy": {{
-    "total_sources_needed": nombre (adapté au score),
-    "sources_per_section": nombre,
-    "search_depth": "quick|standard|exhaustive"
-  }}
-}}
-
-EXEMPLES:
-
-Pour "c'est quoi Rust":
-{{
-  "complexity_analysis": {{"overall_score": 1.2, "target_length": "concis", "estimated_words": 600}},
-  "sections": ["Définition", "Principaux usages"],
-  "section_targets": {{
-    "Définition": {{"words_target": 300, "depth": "light", "objectives": ["Expliquer Rust simplement"], "key_questions": ["Qu'est-ce que Rust?"]}},
-    "Principaux usages": {{"words_target": 300, "depth": "light", "objectives": ["Lister cas d'usage"], "key_questions": ["Pour quoi utiliser Rust?"]}}
-  }},
-  "narrative_flow": [{{"from_section": "Définition", "to_section": "Principaux usages", "transition_type": "zoom-in", "rationale": "Après avoir défini, montrer applications concrètes"}}],
-  "search_strategy": {{"total_sources_needed": 5, "sources_per_section": 2, "search_depth": "quick"}}
-}}
-
-Pour "Écosystème Rust 2024, adoption, roadmap":
-{{
-  "complexity_analysis": {{"overall_score": 4.6, "target_length": "approfondi", "estimated_words": 3500}},
-  "sections": ["Vue d'ensemble", "Écosystème technique", "Adoption entreprise", "Cas d'usage", "Roadmap", "Défis"],
-  "section_targets": {{
-    "Vue d'ensemble": {{"words_target": 400, "depth": "moderate", "objectives": ["Situer Rust en 2024"], "key_questions": ["Quelle position actuelle?", "Pourquoi pertinent?"]}},
-    "Écosystème technique": {{"words_target": 700, "depth": "deep", "objectives": ["Analyser tooling, libs, communauté"], "key_questions": ["Quels outils?", "Maturité?"]}},
-    ...
-  }},
-  "narrative_flow": [
-    {{"from_section": "Vue d'ensemble", "to_section": "Écosystème technique", "transition_type": "zoom-in", "rationale": "Après contexte global, détailler aspects techniques"}},
-    {{"from_section": "Écosystème technique", "to_section": "Adoption entreprise", "transition_type": "cause-effect", "rationale": "Maturité technique → adoption business"}},
-    ...
-  ],
-  "search_strategy": {{"total_sources_needed": 15, "sources_per_section": 3, "search_depth": "exhaustive"}}
-}}
+{_jdumps(context) if context else "Aucun"}
 
 IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_found[:5])}
 """
 
         try:
-            response = await self.llm_client.generate(
-                [{"role": "user", "content": prompt}],
+            response = await self._generate(
+                [
+                    {"role": "system", "content": _DETAILED_PLAN_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
                 max_tokens=3000,
-                temperature=0.2
+                temperature=0.2,
+                stop_at_json=True,
+                **self._json_mode
             )
 
-            # Parser JSON
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            plan = json.loads(response[start_idx:i + 1])
-                            logger.info(f"     → Plan créé: {len(plan.get('sections', []))} sections")
-                            return plan
+            # Parser JSON (scanner C, gère les accolades dans les chaînes)
+            plan = extract_json(response)
+            if isinstance(plan, dict):
+                logger.info(f"     → Plan créé: {len(plan.get('sections', []))} sections")
+                return plan
 
-        except Exception as e:
+        except (LLMClientError, TimeoutError) as e:
             logger.error(f"  ❌ Erreur planification: {e}")
 
         # Fallback: plan standard
@@ -2405,6 +2987,57 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
             "search_strategy": {"total_sources_needed": 10, "sources_per_section": 3, "search_depth": "standard"}
         }
 
+    async def _build_section(
+        self,
+        query: str,
+        section_name: str,
+        section_config: Dict,
+        exploration_data: Dict,
+        context: ExecutionContext,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[List[Dict]]:
+        """
+        PHASE 2: Collecte des données d'une section.
+
+        Enchaîne recherche → extraction. Le croisement (qui dépend des données
+        des sections précédentes) et la synthèse sont faits ensuite par
+        l'appelant. Ne modifie pas context.final_content.
+
+        Retourne les données extraites, None en cas d'échec.
+        """
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        async with semaphore:
+            try:
+                if log_info:
+                    logger.info(f"\n  📝 Section: {section_name}")
+                    logger.info(f"     Profondeur: {section_config.get('depth', 'moderate')}")
+                    logger.info(f"     Objectif: ~{section_config.get('words_target', 500)} mots")
+
+                # Étape 2.1: Recherches ciblées pour cette section
+                section_data = await self._section_research_phase(
+                    query=query,
+                    section_name=section_name,
+                    section_config=section_config,
+                    exploration_data=exploration_data,
+                    context=context
+                )
+                logger.info(f"     ✓ {len(section_data.get('sources', []))} sources collectées")
+
+                # Étape 2.2: Extraction et analyse des sources
+                extracted_data = await self._section_extraction_phase(
+                    section_name=section_name,
+                    section_data=section_data,
+                    context=context
+                )
+                logger.info(f"     ✓ {len(extracted_data)} contenus extraits")
+
+                return extracted_data
+
+            except Exception as e:
+                logger.error(f"     ❌ Erreur construction section '{section_name}': {e}")
+                return None
+
     async def _section_research_phase(
         self,
         query: str,
@@ -2431,23 +3064,25 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
 
         # Nombre de sources selon profondeur
         depth = section_config.get("depth", "moderate")
-        max_sources = {"light": 3, "moderate": 5, "deep": 8}.get(depth, 5)
+        max_sources = _MAX_SOURCES_BY_DEPTH.get(depth, 5)
 
         try:
-            search_results = await searxng_client.search(
+            search_results = await self._cached_search(
                 query=search_query,
-                max_results=max_sources
+                max_results=max_sources,
+                ctx=context
             )
 
             sources = []
             if search_results:
+                # islice: pas de copie intermédiaire de la liste des résultats
                 sources = [
                     {
                         "url": r.url,
                         "title": r.title,
-                        "snippet": r.content[:300] if r.content else ""
+                        "snippet": (r.content or "")[:300]
                     }
-                    for r in search_results[:max_sources]
+                    for r in itertools.islice(search_results, max_sources)
                 ]
 
                 # Tracker la recherche
@@ -2499,70 +3134,93 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
         if not urls:
             return []
 
-        # Utiliser webextractor
-        try:
-            extractor_manager = ExtractorManager()
-            options = ExtractionOptions(
-                extract_images=False,
-                extract_links=False,
-                clean_html=True,
-                use_agent=True,
-                headless=True
-            )
+        # Utiliser webextractor (manager de l'orchestrateur: extracteurs réutilisés entre sections).
+        # URLs extraites en parallèle (bornées par self._extract_semaphore), chaque échec
+        # ou timeout ne concerne que son URL; résultats traités dans l'ordre des sources
+        urls = urls[:5]  # Limiter à 5 URLs max pour éviter timeout
+        results = await asyncio.gather(
+            *(self._extract_section_url(url) for url in urls),
+            return_exceptions=True
+        )
 
-            # Extraire chaque URL séquentiellement
-            extracted_data = []
-            for url in urls[:5]:  # Limiter à 5 URLs max pour éviter timeout
-                try:
-                    result = await extractor_manager.extract(
-                        url=url,
-                        llm_client=self.llm_client,
-                        options=options
-                    )
+        extracted_data = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"       ⚠️ Extraction failed for {url}: {result}")
+                context.add_step(
+                    "webextractor",
+                    f"extract_content_for_{section_name}",
+                    url,
+                    str(result),
+                    False
+                )
+                continue
 
-                    if result.success and result.content:
-                        extracted_data.append({
-                            "source": url,
-                            "title": result.title or "",
-                            "content": result.content[:3000],  # Limiter à 3000 chars
-                            "metadata": {}
-                        })
+            if result.success and result.content:
+                extracted_data.append({
+                    "source": url,
+                    "title": result.title or "",
+                    "content": result.content[:3000],  # Limiter à 3000 chars
+                    "metadata": {}
+                })
 
-                        # Tracker l'extraction
-                        if url not in context.discovered_sources:
-                            context.discovered_sources.append(url)
-                        context.add_step(
-                            "webextractor",
-                            f"extract_content_for_{section_name}",
-                            url,
-                            {"title": result.title, "content_length": len(result.content)},
-                            True
-                        )
-                    else:
-                        context.add_step(
-                            "webextractor",
-                            f"extract_content_for_{section_name}",
-                            url,
-                            None,
-                            False
-                        )
-                except Exception as url_error:
-                    logger.warning(f"       ⚠️ Extraction failed for {url}: {url_error}")
-                    context.add_step(
-                        "webextractor",
-                        f"extract_content_for_{section_name}",
-                        url,
-                        str(url_error),
-                        False
-                    )
-                    continue
+                # Tracker l'extraction
+                context.add_discovered_source(url)
+                context.add_step(
+                    "webextractor",
+                    f"extract_content_for_{section_name}",
+                    url,
+                    {"title": result.title, "content_length": len(result.content)},
+                    True
+                )
+            else:
+                context.add_step(
+                    "webextractor",
+                    f"extract_content_for_{section_name}",
+                    url,
+                    None,
+                    False
+                )
 
-            logger.info(f"       → {len(extracted_data)}/{len(urls)} sources extraites")
-            return extracted_data
+        # Miroirs et pages identiques sous des URLs différentes
+        extracted_data = _dedupe_by_content(extracted_data)
 
-        except Exception as e:
-            logger.error(f"       ❌ Erreur extraction: {e}")
-            return []
+        logger.info(f"       → {len(extracted_data)}/{len(urls)} sources extraites")
+        return extracted_data
+
+    async def _extract_section_url(self, url: str) -> Any:
+        """
+        Extraction d'une URL pour une section, mutualisée entre les sections.
+
+        La tâche d'extraction est enregistrée dans self._url_cache avant d'être
+        attendue: une section qui demande la même URL (en parallèle ou plus tard)
+        réutilise le même résultat. Les échecs ne sont pas conservés.
+        """
+        task = self._url_cache.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_section_url(url))
+            self._url_cache.set(url, task)
+
+            def forget_failure(done: asyncio.Future):
+                if done.cancelled() or done.exception() is not None or not done.result().success:
+                    self._url_cache.pop(url)
+
+            task.add_done_callback(forget_failure)
+        else:
+            logger.debug(f"       ♻️ Extraction mutualisée: {url}")
+
+        # shield: l'annulation d'une section n'interrompt pas le fetch partagé
+        return await asyncio.shield(task)
+
+    async def _fetch_section_url(self, url: str) -> Any:
+        """Fetch d'une source de section, borné par l'admission globale des extractions."""
+        async with self._extract_semaphore:
+            async with asyncio.timeout(_SECTION_FETCH_TIMEOUT):
+                return await self.extractor_manager.extract(
+                    url=url,
+                    llm_client=self.llm_client,
+                    options=_SECTION_EXTRACT_OPTS
+                )
 
     def _cross_reference_data(
         self,
@@ -2578,26 +3236,20 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
         """
         logger.info(f"       🔗 Croisement données pour '{section_name}'")
 
-        # Pour chaque nouvelle donnée, chercher mentions dans données existantes
+        # Index inversé source -> sections: une recherche par donnée au lieu
+        # de parcourir les raw_data de toutes les autres sections
+        source_index = context.source_index
+
         enriched = []
         for data_point in new_data:
-            enriched_point = data_point.copy()
-            enriched_point["cross_references"] = []
-
-            # Chercher dans autres sections
-            for other_section, section_content in context.final_content['sections'].items():
-                if other_section == section_name:
-                    continue
-
-                # Vérifier si URL apparaît dans raw_data
-                for existing_data in section_content.get('raw_data', []):
-                    if isinstance(existing_data, dict) and existing_data.get('source') == data_point.get('source'):
-                        enriched_point["cross_references"].append({
-                            "section": other_section,
-                            "note": "Même source utilisée"
-                        })
+            cross_references = [
+                {"section": other_section, "note": "Même source utilisée"}
+                for other_section in source_index.get(data_point.get('source'), ())
+                if other_section != section_name
+            ]
 
-            enriched.append(enriched_point)
+            # Dictionnaire final construit en une fois (pas de copie puis ajout de clé)
+            enriched.append({**data_point, "cross_references": cross_references})
 
         cross_ref_count = sum(1 for e in enriched if e.get("cross_references"))
         if cross_ref_count > 0:
@@ -2605,19 +3257,164 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
 
         return enriched
 
+    async def _synthesize_sections_batch(
+        self,
+        query: str,
+        section_targets: Dict[str, Dict],
+        enriched_per_section: Dict[str, List[Dict]],
+        context: ExecutionContext
+    ) -> Dict[str, str]:
+        """
+        PHASE 2.4: Synthèse groupée des sections.
+
+        Plusieurs sections sont rédigées par un seul appel LLM (réponse JSON
+        {titre: contenu}): le coût fixe d'une requête (réseau, latence du premier
+        token) est payé une fois par lot au lieu d'une fois par section. Les lots
+        sont bornés en données injectées et en tokens de sortie. Une section
+        isolée, trop volumineuse ou absente de la réponse est rédigée seule
+        (_synthesize_single_section).
+
+        Retourne {section_name: contenu} pour les sections rédigées.
+        """
+        batches: List[List[Tuple[str, str, int]]] = []
+        singles: List[str] = []
+        # Sélection faite une fois par section, réutilisée par le repli unitaire
+        selected_per_section: Dict[str, List[Dict]] = {}
+        current: List[Tuple[str, str, int]] = []
+        current_chars = current_tokens = 0
+
+        for section_name, enriched_data in enriched_per_section.items():
+            section_config = section_targets.get(section_name, {})
+            words_target = section_config.get("words_target", 500)
+            max_tokens = int(words_target * 2.5)
+
+            selected_data = self._semantic_chunk_selection(
+                all_data=enriched_data,
+                query=f"{query} {section_name}",
+                max_chars=words_target * 10,
+                depth=section_config.get("depth", "moderate")
+            )
+            selected_per_section[section_name] = selected_data
+            objectives = "; ".join(section_config.get("objectives", [])) or "-"
+            key_questions = "; ".join(section_config.get("key_questions", [])) or "-"
+            depth_instructions = _DEPTH_INSTRUCTIONS.get(
+                section_config.get("depth", "moderate"), "Rédige un contenu équilibré."
+            )
+            block = (
+                f"### {section_name}\n"
+                f"Objectifs: {objectives}\n"
+                f"Questions clés: {key_questions}\n"
+                f"Instructions: {depth_instructions} Objectif approximatif: ~{words_target} mots\n"
+                f"Données ({len(selected_data)} sources): {_jdumps(selected_data[:5], indent=False)}"
+            )
+
+            if len(block) > _BATCH_SYNTHESIS_MAX_CHARS or max_tokens > _BATCH_SYNTHESIS_MAX_TOKENS:
+                singles.append(section_name)
+                continue
+
+            if current and (current_chars + len(block) > _BATCH_SYNTHESIS_MAX_CHARS
+                            or current_tokens + max_tokens > _BATCH_SYNTHESIS_MAX_TOKENS):
+                batches.append(current)
+                current, current_chars, current_tokens = [], 0, 0
+
+            current.append((section_name, block, max_tokens))
+            current_chars += len(block)
+            current_tokens += max_tokens
+
+        if current:
+            batches.append(current)
+
+        # Un lot d'une seule section: le prompt unitaire est plus adapté
+        for batch in batches:
+            if len(batch) == 1:
+                singles.append(batch[0][0])
+        batches = [batch for batch in batches if len(batch) > 1]
+
+        if batches:
+            logger.info(f"       ✍️  Synthèse groupée: {sum(len(b) for b in batches)} sections en {len(batches)} appel(s) LLM")
+
+        contents: Dict[str, str] = {}
+        for batch_contents in await asyncio.gather(*(self._synthesize_batch(query, batch) for batch in batches)):
+            contents.update(batch_contents)
+
+        # Repli unitaire: sections non groupées ou manquantes dans la réponse
+        singles.extend(
+            name for batch in batches for name, _, _ in batch if name not in contents
+        )
+        if singles:
+            single_contents = await asyncio.gather(*(
+                self._synthesize_single_section(
+                    query=query,
+                    section_name=name,
+                    section_config=section_targets.get(name, {}),
+                    selected_data=selected_per_section[name],
+                    context=context
+                )
+                for name in singles
+            ))
+            contents.update(zip(singles, single_contents))
+
+        return contents
+
+    async def _synthesize_batch(
+        self,
+        query: str,
+        batch: List[Tuple[str, str, int]]
+    ) -> Dict[str, str]:
+        """
+        Rédige un lot de sections en un appel LLM.
+
+        Args:
+            batch: (section_name, bloc du prompt, max_tokens) par section
+
+        Returns:
+            {section_name: contenu} pour les sections présentes dans la réponse
+        """
+        prompt = _BATCH_SYNTHESIS_TEMPLATE.substitute(
+            query=query,
+            sections="\n\n".join(block for _, block, _ in batch),
+            keys=", ".join(f'{_jdumps(name, indent=False)}: "..."' for name, _, _ in batch)
+        )
+
+        try:
+            response = await self._generate(
+                [{"role": "user", "content": prompt}],
+                max_tokens=sum(max_tokens for _, _, max_tokens in batch),
+                temperature=0.3,
+                stop_at_json=True,
+                **self._json_mode
+            )
+        except (LLMClientError, TimeoutError) as e:
+            logger.error(f"       ❌ Erreur synthèse groupée: {e}")
+            return {}
+
+        result = extract_json(response)
+        if not isinstance(result, dict):
+            logger.warning("       ⚠️ Synthèse groupée: réponse non JSON, repli section par section")
+            return {}
+
+        contents = {}
+        for name, _, _ in batch:
+            content = result.get(name)
+            if isinstance(content, str) and content.strip():
+                contents[name] = content.strip()
+                logger.info(f"       → {name}: ~{content.count(' ') + 1} mots générés")
+
+        return contents
+
     async def _synthesize_single_section(
         self,
         query: str,
         section_name: str,
         section_config: Dict,
-        enriched_data: List[Dict],
+        selected_data: List[Dict],
         context: ExecutionContext
     ) -> str:
         """
         PHASE 2.4: Synthèse d'une section unique.
 
         Génère le contenu rédigé de la section en utilisant:
-        - Les données enrichies
+        - Les données enrichies déjà sélectionnées (_synthesize_sections_batch)
         - Les objectifs de la section
         - La profondeur cible
         """
@@ -2628,58 +3425,35 @@ IMPORTANT: Adapte la structure aux sous-thèmes découverts: {', '.join(topics_f
         objectives = section_config.get("objectives", [])
         key_questions = section_config.get("key_questions", [])
 
-        # Sélection sémantique adaptée
-        selected_data = self._semantic_chunk_selection(
-            all_data=enriched_data,
-            query=f"{query} {section_name}",
-            max_chars=words_target * 10,  # Approximation
-            depth=depth
-        )
-
         # Construire le prompt de synthèse
-        depth_instructions = {
-            "light": "Rédige 2-3 paragraphes concis allant à l'essentiel.",
-            "moderate": "Rédige 4-6 paragraphes équilibrés et informatifs.",
-            "deep": "Rédige 6-10 paragraphes détaillés explorant tous les aspects."
-        }.get(depth, "Rédige un contenu équilibré.")
-
-        prompt = f"""Rédige la section "{section_name}" pour répondre à: "{query}"
+        depth_instructions = _DEPTH_INSTRUCTIONS.get(depth, "Rédige un contenu équilibré.")
 
-OBJECTIFS DE CETTE SECTION:
-{chr(10).join(f'- {obj}' for obj in objectives)}
-
-QUESTIONS CLÉS À EXPLORER:
-{chr(10).join(f'- {q}' for q in key_questions)}
-
-INSTRUCTIONS:
-{depth_instructions}
-
-DONNÉES DISPONIBLES ({len(selected_data)} sources):
-{json.dumps(selected_data[:5], indent=2, ensure_ascii=False)}
-
-RÈGLES:
-1. Cite TOUTES les sources avec format [SOURCE:url]
-2. La longueur sera CONSÉQUENCE NATURELLE de la qualité, pas un objectif strict
-3. Objectif approximatif: ~{words_target} mots
-4. Structure: paragraphes cohérents, pas de listes à puces
-5. Ton: informatif, précis, fluide
-
-Rédige uniquement le contenu (pas de titre de section, pas de métadonnées).
-"""
+        prompt = _SECTION_SYNTHESIS_TEMPLATE.substitute(
+            section_name=section_name,
+            query=query,
+            objectives=_bullet_list(objectives),
+            key_questions=_bullet_list(key_questions),
+            depth_instructions=depth_instructions,
+            n_sources=len(selected_data),
+            data=_jdumps(selected_data[:5]),
+            words_target=words_target
+        )
 
         try:
-            response = await self.llm_client.generate(
+            response = await self._generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=int(words_target * 2.5),
                 temperature=0.3
             )
 
-            word_count = len(response.split())
-            logger.info(f"       → {word_count} mots générés")
+            content = (response or "").strip()
+            if logger.isEnabledFor(logging.INFO):
+                # Approximation sans allouer la liste des mots
+                logger.info(f"       → ~{content.count(' ') + 1} mots générés")
 
-            return response.strip()
+            return content
 
-        except Exception as e:
+        except (LLMClientError, TimeoutError) as e:
             logger.error(f"       ❌ Erreur synthèse: {e}")
             return f"[Erreur lors de la génération de la section {section_name}]"
 
@@ -2699,13 +3473,21 @@ Rédige uniquement le contenu (pas de titre de section, pas de métadonnées).
         """
         logger.info("  🔍 Analyse inter-sections")
 
+        # Rapports courts ou peu complexes: peu d'enchaînements à revoir, on évite l'appel LLM
+        overall_score = plan.get('complexity_analysis', {}).get('overall_score', 3.0)
+        if len(plan.get('sections', [])) < 3 or (
+            isinstance(overall_score, (int, float)) and overall_score < 2.5
+        ):
+            logger.info("  ✓ Rapport court: analyse inter-sections non nécessaire")
+            return {"improvements": [], "redundancies": [], "coherence_score": 90}
+
         sections_content = []
         for section_name, section_data in context.final_content['sections'].items():
             sections_content.append({
                 "title": section_name,
-                "content_preview": section_data.get('content', '')[:500],
-                "word_count": len(section_data.get('content', '').split()),
-                "sources_count": len(section_data.get('raw_data', []))
+                "content_preview": section_data.content[:500],
+                "word_count": section_data.word_count,
+                "sources_count": len(section_data.raw_data)
             })
 
         prompt = f"""Analyse la cohérence globale de ce rapport en cours de construction.
@@ -2713,10 +3495,10 @@ Rédige uniquement le contenu (pas de titre de section, pas de métadonnées).
 REQUÊTE INITIALE: "{query}"
 
 SECTIONS GÉNÉRÉES:
-{json.dumps(sections_content, indent=2, ensure_ascii=False)}
+{_jdumps(sections_content)}
 
 ENCHAÎNEMENTS PRÉVUS:
-{json.dumps(plan.get('narrative_flow', []), indent=2)}
+{_jdumps(plan.get('narrative_flow', []))}
 
 Ta mission: Identifier améliorations de cohérence.
 
@@ -2739,25 +3521,19 @@ Retourne JSON:
 """
 
         try:
-            response = await self.llm_client.generate(
+            response = await self._generate(
                 [{"role": "user", "content": prompt}],
                 max_tokens=1500,
-                temperature=0.2
+                temperature=0.2,
+                stop_at_json=True,
+                **self._json_mode
             )
 
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            analysis = json.loads(response[start_idx:i + 1])
-                            return analysis
+            analysis = extract_json(response)
+            if isinstance(analysis, dict):
+                return analysis
 
-        except Exception as e:
+        except (LLMClientError, TimeoutError) as e:
             logger.error(f"  ❌ Erreur analyse cohérence: {e}")
 
         return {"improvements": [], "redundancies": [], "coherence_score": 75}
@@ -2772,6 +3548,12 @@ Retourne JSON:
 
         Modifie les sections in-place pour ajouter transitions, liens, etc.
         """
+        # Rapport jugé cohérent: aucune retouche
+        coherence_score = coherence_analysis.get("coherence_score")
+        if isinstance(coherence_score, (int, float)) and coherence_score >= 85:
+            logger.info(f"  ✓ Cohérence suffisante ({coherence_score}/100)")
+            return
+
         improvements = coherence_analysis.get("improvements", [])
         high_priority = [i for i in improvements if i.get("priority") == "high"]
 
@@ -2789,11 +3571,11 @@ Retourne JSON:
             if imp_type == "transition" and len(sections_involved) == 2:
                 # Ajouter transition entre deux sections
                 section_a, section_b = sections_involved
-                if section_a in context.final_content['sections'] and section_b in context.final_content['sections']:
+                sections = context.final_content['sections']
+                section = sections.get(section_a)
+                if section is not None and section_b in sections:
                     # Ajouter phrase de transition à la fin de section A
-                    current_content = context.final_content['sections'][section_a]['content']
-                    transition_text = f"\n\n{suggestion}"
-                    context.final_content['sections'][section_a]['content'] = current_content + transition_text
+                    section.append_content(suggestion)
                     logger.info(f"     → Transition ajoutée: {section_a} → {section_b}")
 
     async def _final_assembly(
@@ -2809,25 +3591,22 @@ Retourne JSON:
         """
         logger.info("  📦 Assemblage final")
 
-        sections_list = []
-        total_words = 0
-
-        for section_name in plan.get("sections", []):
-            if section_name in context.final_content['sections']:
-                section_data = context.final_content['sections'][section_name]
-                content = section_data.get('content', '')
-                word_count = len(content.split())
-                total_words += word_count
-
-                sections_list.append({
-                    "title": section_name,
-                    "content": content,
-                    "data": section_data.get('raw_data', []),
-                    "metadata": {
-                        "word_count": word_count,
-                        "sources_count": len(section_data.get('raw_data', []))
-                    }
-                })
+        # Une seule recherche par section (walrus); nombre de mots déjà tenu par Section
+        sections = context.final_content['sections']
+        sections_list = [
+            {
+                "title": section_name,
+                "content": section_data.content,
+                "data": section_data.raw_data,
+                "metadata": {
+                    "word_count": section_data.word_count,
+                    "sources_count": len(section_data.raw_data)
+                }
+            }
+            for section_name in plan.get("sections", [])
+            if (section_data := sections.get(section_name)) is not None
+        ]
+        total_words = sum(section["metadata"]["word_count"] for section in sections_list)
 
         # Générer titre et summary
         complexity = plan.get("complexity_analysis", {})
@@ -2838,7 +3617,8 @@ Retourne JSON:
         if sections_list:
             first_content = sections_list[0].get("content", "")
             # Prendre les 2 premières phrases
-            sentences = first_content.split('. ')[:2]
+            # maxsplit: le découpage s'arrête après la 2e phrase (pas de scan du texte entier)
+            sentences = first_content.split('. ', 2)[:2]
             summary = '. '.join(sentences) + '.' if sentences else "Rapport de recherche approfondie."
 
         final_report = {
@@ -2854,8 +3634,9 @@ Retourne JSON:
             }
         }
 
-        # Conversion sources → bibliographie
-        final_report = self._convert_sources_to_bibliography(final_report)
+        # Conversion sources → bibliographie, hors de la boucle d'événements (regex sur
+        # tout le rapport). final_report est local et pas encore partagé: pas de copie
+        final_report = await asyncio.to_thread(self._convert_sources_to_bibliography, final_report)
 
         logger.info(f"  ✓ Rapport assemblé: {total_words} mots, {len(sections_list)} sections")
 
@@ -2890,7 +3671,7 @@ Retourne JSON:
             "construction_phase": {
                 "sections_built": list(context.final_content['sections'].keys()),
                 "total_sources_collected": sum(
-                    len(s.get('raw_data', []))
+                    len(s.raw_data)
                     for s in context.final_content['sections'].values()
                 ),
                 "steps_executed": len(context.steps)
@@ -2,19 +2,195 @@
 Agent de recherche profonde utilisant albert-code pour navigation intelligente.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
-from typing import List, Optional, Set, Dict
+import time
+from typing import List, Optional, Set, Dict, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 import httpx
+import orjson
+import lxml.html
+from lxml import etree
 
 from app.core.llm.base import BaseLLMClient
 from app.extractors.direct_extractor import DirectExtractor
 from app.api.models import SourceInfo, NavigationStep, WebResult
+from app.utils.cache import TTLCache
+from app.utils.json_utils import extract_json
 
 logger = logging.getLogger(__name__)
 
+# Liens non suivis (ancres, scripts, mails, fichiers): un seul scan C par URL
+_SKIP_LINK_RE = re.compile(r'#|javascript:|mailto:|\.pdf|\.zip', re.IGNORECASE)
+
+# Mots (sans ponctuation) pour le fallback de pertinence par mots-clés
+_WORD_RE = re.compile(r'\w+')
+
+# Ouvertures de liens <a href=...>: délimitent le préfixe HTML à parser
+_ANCHOR_RE = re.compile(r'<a\s[^>]*href=', re.IGNORECASE)
+_MAX_PARSED_ANCHORS = 100
+
+# Paramètres de suivi sans effet sur le contenu de la page
+_TRACKING_PARAM_RE = re.compile(r'utm_\w+|fbclid|gclid', re.IGNORECASE)
+
+# Distance de Hamming maximale entre deux SimHash de liens quasi identiques
+_SIMHASH_MAX_DISTANCE = 3
+
+# Début de page examiné par le pré-filtre de pertinence (avant appel LLM)
+_PREFILTER_CHARS = 2000
+
+# Balises ```json ... ``` autour des réponses LLM
+_CODEFENCE_RE = re.compile(r'```(?:json)?\n?|\n?```')
+
+# Réponses LLM réutilisées d'une recherche à l'autre (un agent est créé par requête).
+# Clé exacte: modèle + requête normalisée + données injectées dans le prompt
+_RELEVANCE_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_LINKS_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# Pages extraites par URL: (instant d'extraction, WebResult, validateurs HTTP).
+# Fraîches pendant _PAGE_FRESH_SECONDS, puis revalidées par une requête HEAD
+# conditionnelle (ETag / Last-Modified) avant de relancer l'extraction complète
+_PAGE_CACHE = TTLCache(maxsize=256, ttl=24 * 3600)
+_PAGE_FRESH_SECONDS = 3600
+
+# Client HTTP partagé des requêtes HEAD (keep-alive): créé au premier appel,
+# fermé par close_http_client() à l'arrêt de l'application
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+# Instructions statiques en message système, données variables en message
+# utilisateur: le préfixe identique d'un appel à l'autre profite du cache de
+# prompt côté fournisseur
+_RELEVANCE_SYSTEM_PROMPT = """Analyse le contenu web fourni pour la requête utilisateur.
+
+Réponds au format JSON STRICT (pas de markdown):
+{
+  "is_relevant": true/false,
+  "score": 0.0-1.0,
+  "excerpt": "extrait pertinent de 200 caractères max"
+}
+
+IMPORTANT: Réponds UNIQUEMENT le JSON, rien d'autre."""
+
+_RELEVANCE_BATCH_SYSTEM_PROMPT = """Analyse les contenus web fournis (items numérotés) pour la requête utilisateur.
+
+Réponds au format JSON STRICT (pas de markdown), un résultat par item:
+{
+  "results": [
+    {
+      "idx": 0,
+      "is_relevant": true/false,
+      "score": 0.0-1.0,
+      "excerpt": "extrait pertinent de 200 caractères max"
+    }
+  ]
+}
+
+IMPORTANT: Réponds UNIQUEMENT le JSON, rien d'autre."""
+
+_LINKS_SYSTEM_PROMPT = """Identifie les liens les PLUS pertinents pour répondre à la requête utilisateur.
+
+Réponds au format JSON STRICT (pas de markdown):
+{
+  "selected_urls": ["url1", "url2", ...],
+  "reason": "explication courte"
+}
+
+Sélectionne maximum 5 liens les plus pertinents. UNIQUEMENT le JSON."""
+
+
+def _loads_llm_json(text: str):
+    """Décode une réponse JSON du LLM (orjson, puis json non strict si caractères de contrôle)."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text, strict=False)
+
+
+def _strip_tracking(url: str) -> str:
+    """Retire les paramètres de suivi (utm_*, fbclid, gclid) et le fragment d'une URL."""
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not _TRACKING_PARAM_RE.fullmatch(key)
+        ])
+    return urlunsplit(parts._replace(query=query, fragment=""))
+
+
+def _simhash(text: str) -> int:
+    """SimHash 64 bits des mots d'un texte (textes proches -> empreintes proches)."""
+    weights = [0] * 64
+    for word in _WORD_RE.findall(text.lower()):
+        h = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _dedupe_links(links: List[Dict[str, str]], limit: int) -> List[Dict[str, str]]:
+    """
+    Retire les liens en double avant de les soumettre au LLM.
+
+    Doublons exacts: même texte, domaine, chemin et paramètres une fois les
+    paramètres de suivi retirés. Quasi-doublons (pagination, variantes): SimHash
+    du texte, du chemin et des paramètres à une distance de Hamming
+    <= _SIMHASH_MAX_DISTANCE d'un lien gardé du même domaine.
+    """
+    seen = set()
+    fingerprints: Dict[str, List[int]] = {}
+    kept = []
+
+    for link in links:
+        url = _strip_tracking(link["url"])
+        parts = urlsplit(url)
+        key = (link["text"].lower(), parts.netloc, parts.path, parts.query)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        fingerprint = _simhash(f"{link['text']} {parts.path} {parts.query}")
+        site_fingerprints = fingerprints.setdefault(parts.netloc, [])
+        if any((fingerprint ^ other).bit_count() <= _SIMHASH_MAX_DISTANCE for other in site_fingerprints):
+            continue
+
+        site_fingerprints.append(fingerprint)
+        kept.append({"url": url, "text": link["text"]})
+        if len(kept) >= limit:
+            break
+
+    return kept
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Retourne le client HTTP poolé, en le (re)créant si nécessaire."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=5.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Ferme le client HTTP partagé."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _cache_key(*parts: str) -> bytes:
+    """Empreinte compacte d'une combinaison de chaînes (clé de cache)."""
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
 
 class ResearchAgent:
     """
@@ -29,19 +205,28 @@ class ResearchAgent:
         self,
         llm_client: BaseLLMClient,
         max_depth: int = 2,
-        max_sources: int = 5
+        max_sources: int = 5,
+        max_concurrent_pages: int = 5
     ):
         self.llm_client = llm_client
         self.max_depth = max_depth
         self.max_sources = max_sources
         self.extractor = DirectExtractor()
 
+        # Limite les extractions de pages simultanées
+        self._page_semaphore = asyncio.Semaphore(max_concurrent_pages)
+
         # Tracking
         self.visited_urls: Set[str] = set()
+        # Toutes les URLs déjà tentées (y compris les extractions en échec)
+        self._attempted_urls: Set[str] = set()
         self.sources: List[SourceInfo] = []
         self.navigation_path: List[NavigationStep] = []
         self.total_links_analyzed = 0
 
+        # Mots de la requête et motif regex associé (fallback par mots-clés)
+        self._query_terms: Dict[str, Tuple[frozenset, Optional[re.Pattern]]] = {}
+
     async def research(
         self,
         query: str,
@@ -94,76 +279,146 @@ class ResearchAgent:
             logger.info(f"Max sources {self.max_sources} reached")
             return
 
-        for url in urls:
-            if url in self.visited_urls:
-                continue
-
-            if len(self.sources) >= self.max_sources:
-                break
+        # Extraction de chaque URL en parallèle (indépendantes)
+        pending = [url for url in dict.fromkeys(urls) if url not in self._attempted_urls]
+        self._attempted_urls.update(pending)
+        outcomes = await asyncio.gather(
+            *(self._process_one(url) for url in pending),
+            return_exceptions=True
+        )
 
-            # Extraire le contenu
-            result = await self._extract_page(url)
-            if not result or not result.success:
+        pages = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error processing page: {outcome}")
+                continue
+            if outcome is None:
                 continue
 
+            url, result = outcome
             self.visited_urls.add(url)
+            pages.append((url, result))
 
-            # Analyser la pertinence avec albert-code
-            relevance = await self._analyze_relevance(
-                query=query,
-                content=result.content[:10000],  # Limiter pour le prompt
-                url=url
-            )
+        if not pages:
+            return
+
+        # Pertinence de toutes les pages du niveau en un seul appel albert-code
+        relevances = await self._analyze_relevance_batch(
+            query=query,
+            items=[(url, result.content[:10000]) for url, result in pages]  # Limiter pour le prompt
+        )
+
+        hits = [
+            (url, result, relevance)
+            for (url, result), relevance in zip(pages, relevances)
+            if relevance["is_relevant"]
+        ]
+
+        # Les plus pertinentes d'abord, dans la limite des sources restantes
+        hits.sort(key=lambda hit: hit[2]["score"], reverse=True)
 
-            if relevance["is_relevant"]:
-                # Ajouter aux sources
-                self.sources.append(SourceInfo(
-                    url=url,
-                    title=result.title or url,
-                    excerpt=relevance["excerpt"],
-                    relevance_score=relevance["score"],
-                    depth=depth,
-                    visited_at=datetime.now().isoformat()
-                ))
-
-                logger.info(f"Added source: {url} (score: {relevance['score']})")
-
-                # Extraire les liens pertinents si pas à la profondeur max
-                if depth < self.max_depth - 1:
-                    next_urls = await self._extract_relevant_links(
+        for url, result, relevance in hits:
+            if len(self.sources) >= self.max_sources:
+                break
+
+            # Ajouter aux sources
+            self.sources.append(SourceInfo(
+                url=url,
+                title=result.title or url,
+                excerpt=relevance["excerpt"],
+                relevance_score=relevance["score"],
+                depth=depth,
+                visited_at=datetime.now().isoformat()
+            ))
+
+            logger.info(f"Added source: {url} (score: {relevance['score']})")
+
+            # Extraire les liens pertinents si pas à la profondeur max
+            if depth < self.max_depth - 1:
+                next_urls = await self._extract_relevant_links(
+                    query=query,
+                    content=result.content[:20000],
+                    base_url=url
+                )
+
+                if next_urls:
+                    logger.info(f"Found {len(next_urls)} relevant links to follow")
+
+                    self.navigation_path.append(NavigationStep(
+                        from_url=url,
+                        to_url=", ".join(next_urls[:3]),
+                        reason=f"Links found relevant to query",
+                        links_found=len(next_urls)
+                    ))
+
+                    # Navigation récursive
+                    await self._navigate_recursive(
+                        urls=next_urls[:5],  # Limiter le nombre
                         query=query,
-                        content=result.content[:20000],
-                        base_url=url
+                        depth=depth + 1
                     )
 
-                    if next_urls:
-                        logger.info(f"Found {len(next_urls)} relevant links to follow")
-
-                        self.navigation_path.append(NavigationStep(
-                            from_url=url,
-                            to_url=", ".join(next_urls[:3]),
-                            reason=f"Links found relevant to query",
-                            links_found=len(next_urls)
-                        ))
+    async def _process_one(self, url: str) -> Optional[Tuple[str, WebResult]]:
+        """Extrait une page (None si l'extraction échoue)"""
+        async with self._page_semaphore:
+            result = await self._extract_page(url)
 
-                        # Navigation récursive
-                        await self._navigate_recursive(
-                            urls=next_urls[:5],  # Limiter le nombre
-                            query=query,
-                            depth=depth + 1
-                        )
+        if not result or not result.success:
+            return None
+        return url, result
 
     async def _extract_page(self, url: str) -> Optional[WebResult]:
-        """Extrait le contenu d'une page"""
-        try:
-            result = await self.extractor.extract(
+        """Extrait le contenu d'une page (réutilise une extraction récente ou non modifiée)"""
+        entry = _PAGE_CACHE.get(url)
+        if entry is not None:
+            fetched_at, cached_result, validators = entry
+            if time.monotonic() - fetched_at < _PAGE_FRESH_SECONDS:
+                logger.debug(f"Page cache hit: {url}")
+                return cached_result
+
+            if validators:
+                response = await self._head(url, validators)
+                if response is not None and response.status_code == 304:
+                    logger.debug(f"Page not modified: {url}")
+                    _PAGE_CACHE.set(url, (time.monotonic(), cached_result, validators))
+                    return cached_result
+
+        # HEAD en parallèle de l'extraction: récupère les validateurs pour la revalidation
+        # (un HEAD en échec n'invalide pas l'extraction)
+        result, response = await asyncio.gather(
+            self.extractor.extract(
                 url=url,
                 prompt="",
                 options={"timeout": 30, "headless": True}
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Error extracting {url}: {e}")
+            ),
+            self._head(url),
+            return_exceptions=True
+        )
+
+        if isinstance(result, BaseException):
+            logger.error(f"Error extracting {url}: {result}")
+            return None
+        if isinstance(response, BaseException):
+            response = None
+
+        if result and result.success:
+            validators = {}
+            if response is not None and response.status_code < 400:
+                validators = {
+                    name: value for name, value in (
+                        ("If-None-Match", response.headers.get("etag")),
+                        ("If-Modified-Since", response.headers.get("last-modified"))
+                    ) if value
+                }
+            _PAGE_CACHE.set(url, (time.monotonic(), result, validators))
+
+        return result
+
+    async def _head(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[httpx.Response]:
+        """Requête HEAD légère (None en cas d'erreur réseau ou d'URL invalide)."""
+        try:
+            return await _get_http_client().head(url, headers=headers)
+        except (httpx.HTTPError, httpx.InvalidURL):
             return None
 
     async def _analyze_relevance(
@@ -178,52 +433,165 @@ class ResearchAgent:
         Returns:
             Dict avec is_relevant, score, excerpt
         """
-        prompt = f"""Analyse ce contenu web pour la requête utilisateur.
+        cache_key = _cache_key(self.llm_client.model, " ".join(query.lower().split()), url, content[:3000])
+        cached = _RELEVANCE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Relevance cache hit: {url}")
+            return dict(cached)
 
-Requête: "{query}"
-URL: {url}
-Contenu (extrait): {content[:3000]}
+        if self._no_query_overlap(query, content):
+            logger.debug(f"Relevance prefilter: no query word in {url}")
+            return self._keyword_relevance(query, content)
 
-Réponds au format JSON STRICT (pas de markdown):
-{{
-  "is_relevant": true/false,
-  "score": 0.0-1.0,
-  "excerpt": "extrait pertinent de 200 caractères max"
-}}
-
-IMPORTANT: Réponds UNIQUEMENT le JSON, rien d'autre."""
+        prompt = f"""Requête: "{query}"
+URL: {url}
+Contenu (extrait): {content[:3000]}"""
 
         try:
-            messages = [{"role": "user", "content": prompt}]
+            messages = [
+                {"role": "system", "content": _RELEVANCE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
             response = await self.llm_client.generate(messages, max_tokens=500)
 
             # Parser la réponse JSON
             response_clean = response.strip()
             if response_clean.startswith("```"):
-                response_clean = re.sub(r'```json\n?|\n?```', '', response_clean)
+                response_clean = _CODEFENCE_RE.sub('', response_clean)
 
-            import json
-            analysis = json.loads(response_clean)
+            analysis = _loads_llm_json(response_clean)
 
-            return {
+            relevance = {
                 "is_relevant": analysis.get("is_relevant", False),
                 "score": float(analysis.get("score", 0.0)),
                 "excerpt": analysis.get("excerpt", content[:200])
             }
+            _RELEVANCE_CACHE.set(cache_key, relevance)
+            return dict(relevance)
 
         except Exception as e:
             logger.error(f"Error analyzing relevance with LLM: {e}")
-            # Fallback: pertinence basique par mots-clés
-            query_words = set(query.lower().split())
-            content_words = set(content.lower().split())
-            overlap = len(query_words & content_words)
-            score = min(overlap / len(query_words), 1.0) if query_words else 0.0
-
-            return {
-                "is_relevant": score > 0.3,
-                "score": score,
-                "excerpt": content[:200]
-            }
+            return self._keyword_relevance(query, content)
+
+    async def _analyze_relevance_batch(
+        self,
+        query: str,
+        items: List[Tuple[str, str]]
+    ) -> List[Dict]:
+        """
+        Analyse la pertinence de plusieurs pages en un seul appel albert-code.
+
+        Args:
+            query: Requête utilisateur
+            items: Couples (url, contenu)
+
+        Returns:
+            Un Dict is_relevant/score/excerpt par item, dans l'ordre des items
+        """
+        normalized_query = " ".join(query.lower().split())
+        keys = [
+            _cache_key(self.llm_client.model, normalized_query, url, content[:3000])
+            for url, content in items
+        ]
+        relevances: List[Optional[Dict]] = [
+            dict(cached) if (cached := _RELEVANCE_CACHE.get(key)) is not None else None
+            for key in keys
+        ]
+        # Pages sans aucun mot de la requête: pas d'appel LLM
+        missing = [
+            i for i, relevance in enumerate(relevances)
+            if relevance is None and not self._no_query_overlap(query, items[i][1])
+        ]
+
+        # Une seule page à analyser: prompt unitaire (repli ci-dessous)
+        if len(missing) > 1:
+            sections = "\n\n".join(
+                f"## Item {n}\nURL: {items[i][0]}\nContenu (extrait): {items[i][1][:3000]}"
+                for n, i in enumerate(missing)
+            )
+            prompt = f"""Requête: "{query}"
+
+{sections}"""
+
+            try:
+                messages = [
+                    {"role": "system", "content": _RELEVANCE_BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ]
+                response = await self.llm_client.generate(messages, max_tokens=500 * len(missing))
+
+                analysis = extract_json(response)
+                if not isinstance(analysis, dict):
+                    raise ValueError("no JSON object in response")
+
+                for verdict in analysis.get("results", []):
+                    n = verdict.get("idx")
+                    if not isinstance(n, int) or not 0 <= n < len(missing):
+                        continue
+                    i = missing[n]
+                    relevance = {
+                        "is_relevant": verdict.get("is_relevant", False),
+                        "score": float(verdict.get("score", 0.0)),
+                        "excerpt": verdict.get("excerpt", items[i][1][:200])
+                    }
+                    _RELEVANCE_CACHE.set(keys[i], relevance)
+                    relevances[i] = dict(relevance)
+
+            except Exception as e:
+                logger.error(f"Error analyzing batch relevance with LLM: {e}")
+
+        # Pages sans verdict (lot en échec ou item omis): analyse page par page,
+        # bornée comme les extractions
+        unresolved = [i for i in missing if relevances[i] is None]
+        if unresolved:
+            async def analyze_one(i: int) -> Dict:
+                async with self._page_semaphore:
+                    return await self._analyze_relevance(query=query, content=items[i][1], url=items[i][0])
+
+            for i, relevance in zip(unresolved, await asyncio.gather(*map(analyze_one, unresolved))):
+                relevances[i] = relevance
+
+        # Pages écartées par le pré-filtre: pertinence basique par mots-clés
+        return [
+            relevance if relevance is not None else self._keyword_relevance(query, items[i][1])
+            for i, relevance in enumerate(relevances)
+        ]
+
+    def _terms_of_query(self, query: str) -> Tuple[frozenset, Optional[re.Pattern]]:
+        """
+        Mots de la requête et regex les reconnaissant comme mots entiers.
+
+        La regex parcourt la page en C sans créer d'objet Python par mot:
+        seules les occurrences des mots de la requête sont matérialisées.
+        """
+        terms = self._query_terms.get(query)
+        if terms is None:
+            words = frozenset(_WORD_RE.findall(query.lower()))
+            pattern = None
+            if words:
+                alternatives = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+                pattern = re.compile(rf"\b(?:{alternatives})\b")
+            terms = self._query_terms[query] = (words, pattern)
+        return terms
+
+    def _no_query_overlap(self, query: str, content: str) -> bool:
+        """Pré-filtre: aucun mot d'une requête multi-mots dans le début de la page"""
+        query_words, pattern = self._terms_of_query(query)
+        if len(query_words) < 2:
+            return False
+        return pattern.search(content[:_PREFILTER_CHARS].lower()) is None
+
+    def _keyword_relevance(self, query: str, content: str) -> Dict:
+        """Fallback: pertinence basique par mots-clés"""
+        query_words, pattern = self._terms_of_query(query)
+        overlap = len(set(pattern.findall(content.lower()))) if pattern else 0
+        score = min(overlap / len(query_words), 1.0) if query_words else 0.0
+
+        return {
+            "is_relevant": score > 0.3,
+            "score": score,
+            "excerpt": content[:200]
+        }
 
     async def _extract_relevant_links(
         self,
@@ -234,30 +602,45 @@ IMPORTANT: Réponds UNIQUEMENT le JSON, rien d'autre."""
         """
         Utilise albert-code pour identifier les liens pertinents à suivre.
         """
-        # Extraire les liens du HTML
-        soup = BeautifulSoup(content, 'html.parser')
+        # Pré-scan regex: pas de parsing sans lien, et parsing limité au plus
+        # court préfixe contenant _MAX_PARSED_ANCHORS liens
+        count = 0
+        for count, match in enumerate(_ANCHOR_RE.finditer(content), 1):
+            if count > _MAX_PARSED_ANCHORS:
+                content = content[:match.start()]
+                break
+
+        if count == 0:
+            return []
+
+        # Extraire les liens du HTML: iterlinks parcourt l'arbre lxml en C,
+        # sans les objets Python intermédiaires de BeautifulSoup
+        try:
+            root = lxml.html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            return []
+
         links = []
 
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            text = a.get_text(strip=True)
+        for element, attribute, href, _ in root.iterlinks():
+            if element.tag != 'a' or attribute != 'href':
+                continue
 
             # Normaliser l'URL
             if href.startswith('http'):
                 full_url = href
             elif href.startswith('/'):
-                from urllib.parse import urlparse, urljoin
                 full_url = urljoin(base_url, href)
             else:
                 continue
 
             # Filtrer les liens non pertinents
-            if any(x in full_url for x in ['#', 'javascript:', 'mailto:', '.pdf', '.zip']):
+            if _SKIP_LINK_RE.search(full_url):
                 continue
 
             links.append({
                 "url": full_url,
-                "text": text[:100]
+                "text": element.text_content().strip()[:100]
             })
 
         if not links:
@@ -265,45 +648,49 @@ IMPORTANT: Réponds UNIQUEMENT le JSON, rien d'autre."""
 
         self.total_links_analyzed += len(links)
 
-        # Limiter pour le prompt
-        links_sample = links[:20]
+        # Limiter pour le prompt (sans les variantes quasi identiques)
+        links_sample = _dedupe_links(links, limit=20)
 
-        # Demander à albert-code de sélectionner
-        prompt = f"""Identifie les liens les PLUS pertinents pour répondre à cette requête.
+        cache_key = _cache_key(
+            self.llm_client.model,
+            " ".join(query.lower().split()),
+            *(f"{l['text']} -> {l['url']}" for l in links_sample)
+        )
+        cached = _LINKS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Link selection cache hit: {base_url}")
+            return list(cached)
 
-Requête: "{query}"
+        # Demander à albert-code de sélectionner
+        prompt = f"""Requête: "{query}"
 
 Liens disponibles:
-{chr(10).join([f"{i+1}. {l['text']} -> {l['url']}" for i, l in enumerate(links_sample)])}
-
-Réponds au format JSON STRICT (pas de markdown):
-{{
-  "selected_urls": ["url1", "url2", ...],
-  "reason": "explication courte"
-}}
-
-Sélectionne maximum 5 liens les plus pertinents. UNIQUEMENT le JSON."""
+{chr(10).join([f"{i+1}. {l['text']} -> {l['url']}" for i, l in enumerate(links_sample)])}"""
 
         try:
-            messages = [{"role": "user", "content": prompt}]
+            messages = [
+                {"role": "system", "content": _LINKS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
             response = await self.llm_client.generate(messages, max_tokens=1000)
 
             response_clean = response.strip()
             if response_clean.startswith("```"):
-                response_clean = re.sub(r'```json\n?|\n?```', '', response_clean)
+                response_clean = _CODEFENCE_RE.sub('', response_clean)
 
-            import json
-            selection = json.loads(response_clean)
+            selection = _loads_llm_json(response_clean)
 
             selected_urls = selection.get("selected_urls", [])
             logger.info(f"Albert-code selected {len(selected_urls)} links: {selection.get('reason', '')}")
 
-            return selected_urls[:5]
+            selected_urls = selected_urls[:5]
+            _LINKS_CACHE.set(cache_key, selected_urls)
+            return list(selected_urls)
 
         except Exception as e:
             logger.error(f"Error selecting links with LLM: {e}")
             # Fallback: prendre les premiers liens
-            return [l["url"] for l in links[:3]]
+            return [l["url"] for l in links_sample[:3]]
 
     async def _synthesize_answer(self, query: str) -> str:
         """
@@ -313,11 +700,13 @@ Sélectionne maximum 5 liens les plus pertinents. UNIQUEMENT le JSON."""
             return "Aucune information pertinente trouvée."
 
         # Préparer le contexte avec les sources
-        context = f"Requête utilisateur: {query}\n\nSources trouvées:\n\n"
-
-        for i, source in enumerate(self.sources, 1):
-            context += f"Source {i} ({source.url}):\n"
-            context += f"{source.excerpt}\n\n"
+        # (extraits bornés aux 200 caractères demandés à l'analyse de pertinence)
+        parts = [f"Requête utilisateur: {query}\n\nSources trouvées:\n\n"]
+        parts.extend(
+            f"Source {i} ({source.url}):\n{source.excerpt[:200]}\n\n"
+            for i, source in enumerate(self.sources, 1)
+        )
+        context = "".join(parts)
 
         prompt = f"""{context}
 
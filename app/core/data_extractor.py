@@ -5,12 +5,16 @@ Extrait automatiquement des données structurées depuis n'importe quelle source
 indépendamment du domaine (IA, démographie, économie, santé, etc.)
 """
 
+import asyncio
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from app.utils.json_utils import extract_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +101,9 @@ class GenericDataExtractor:
     S'adapte automatiquement au contenu sans configuration domaine-spécifique.
     """
 
+    # Taille max de chaque document dans une extraction par lot
+    BATCH_DOC_MAX_CHARS = 6000
+
     def __init__(self, llm_client):
         self.llm_client = llm_client
 
@@ -202,66 +209,163 @@ RÈGLES CRITIQUES:
             )
 
             # Parser JSON
-            start_idx = response.find('{')
-            if start_idx != -1:
-                bracket_depth = 0
-                for i, char in enumerate(response[start_idx:], start=start_idx):
-                    if char == '{':
-                        bracket_depth += 1
-                    elif char == '}':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            import json
-                            extracted = json.loads(response[start_idx:i + 1])
-
-                            # Construire StructuredData
-                            numerical = [
-                                NumericalData(**n) for n in extracted.get("numerical", [])
-                            ]
-                            temporal = [
-                                TemporalData(**t) for t in extracted.get("temporal", [])
-                            ]
-                            entities = [
-                                EntityData(**e) for e in extracted.get("entities", [])
-                            ]
-                            relationships = [
-                                RelationshipData(**r) for r in extracted.get("relationships", [])
-                            ]
-
-                            # Calculer confiance globale
-                            all_confidences = (
-                                [n.confidence for n in numerical] +
-                                [t.confidence for t in temporal] +
-                                [e.confidence for e in entities] +
-                                [r.confidence for r in relationships]
-                            )
-                            overall_confidence = (
-                                sum(all_confidences) / len(all_confidences)
-                                if all_confidences else 0.0
-                            )
-
-                            structured_data = StructuredData(
-                                source_url=source_url,
-                                numerical=numerical,
-                                temporal=temporal,
-                                entities=entities,
-                                relationships=relationships,
-                                extraction_timestamp=datetime.now().isoformat(),
-                                overall_confidence=overall_confidence
-                            )
-
-                            logger.info(
-                                f"✓ Données extraites: {len(numerical)} num, "
-                                f"{len(temporal)} temp, {len(entities)} ent, "
-                                f"{len(relationships)} rel (conf: {overall_confidence:.2f})"
-                            )
-
-                            return structured_data
+            extracted = extract_json(response)
+            if isinstance(extracted, dict):
+                structured_data = self._build_structured_data(extracted, source_url)
+
+                logger.info(
+                    f"✓ Données extraites: {len(structured_data.numerical)} num, "
+                    f"{len(structured_data.temporal)} temp, {len(structured_data.entities)} ent, "
+                    f"{len(structured_data.relationships)} rel "
+                    f"(conf: {structured_data.overall_confidence:.2f})"
+                )
+
+                return structured_data
 
         except Exception as e:
             logger.error(f"Erreur extraction données structurées: {e}")
 
         # Fallback: retourner structure vide
+        return self._empty_structured_data(source_url)
+
+    async def extract_structured_data_batch(
+        self,
+        docs: List[Tuple[str, str]],
+        topic_context: str = ""
+    ) -> List[StructuredData]:
+        """
+        Extrait les données structurées de plusieurs documents en un seul appel LLM.
+
+        Args:
+            docs: Liste de tuples (source_url, content)
+            topic_context: Contexte du sujet recherché (optionnel)
+
+        Returns:
+            Liste de StructuredData alignée sur docs. Les documents absents ou
+            invalides dans la réponse sont ré-extraits individuellement.
+        """
+        if not docs:
+            return []
+        if len(docs) == 1:
+            url, content = docs[0]
+            return [await self.extract_structured_data(content, url, topic_context)]
+
+        # Limiter chaque document pour garder le lot dans le contexte
+        docs_block = "\n\n".join(
+            f'<doc id="{i}" url="{url}">\n{content[:self.BATCH_DOC_MAX_CHARS]}\n</doc>'
+            for i, (url, content) in enumerate(docs)
+        )
+
+        prompt = f"""Analyse ces {len(docs)} documents et extrait, POUR CHACUN, TOUTES les données structurées pertinentes.
+
+DOCUMENTS:
+{docs_block}
+
+CONTEXTE DU SUJET (optionnel): {topic_context if topic_context else "Analyse générique"}
+
+Pour chaque document, identifier: données numériques (avec unité et période),
+données temporelles (dates, événements), entités (organisations, personnes, lieux,
+produits) et relations entre entités.
+
+Retourne UNIQUEMENT un tableau JSON, un élément par document, avec son id:
+[
+  {{
+    "id": 0,
+    "numerical": [{{"metric": "nom_métrique_générique", "value": 123.45, "unit": "unité", "context": "phrase source", "temporal_marker": "2024", "confidence": 0.9}}],
+    "temporal": [{{"event": "description événement", "date": "2024-01-15", "precision": "day|month|year|quarter", "context": "phrase source", "confidence": 0.9}}],
+    "entities": [{{"name": "Nom Entité", "type": "organization|person|location|product|other", "role": "rôle dans le contexte", "context": "phrase source", "confidence": 0.8}}],
+    "relationships": [{{"entity1": "Entité A", "relation": "type_relation", "entity2": "Entité B", "context": "phrase source", "confidence": 0.7}}]
+  }}
+]
+
+RÈGLES CRITIQUES:
+- Un élément par document, "id" identique à celui de la balise <doc>
+- Ne jamais mélanger les données de deux documents
+- Extraire TOUT chiffre mentionné avec son contexte
+- Ne pas inventer de données absentes
+- Confidence élevée (>0.8) si explicite, moyenne (<0.8) si déduit
+- metric/event/relation en snake_case générique
+"""
+
+        results: List[Optional[StructuredData]] = [None] * len(docs)
+
+        try:
+            response = await self.llm_client.generate(
+                [{"role": "user", "content": prompt}],
+                max_tokens=min(2500 * len(docs), 12000),
+                temperature=0.1
+            )
+
+            records = extract_json(response, start_char="[")
+            if isinstance(records, list):
+                for record in records:
+                    if not isinstance(record, dict):
+                        continue
+                    try:
+                        doc_id = int(record.get("id", -1))
+                        if 0 <= doc_id < len(docs) and results[doc_id] is None:
+                            results[doc_id] = self._build_structured_data(record, docs[doc_id][0])
+                    except Exception as e:
+                        logger.warning(f"Enregistrement batch invalide: {e}")
+
+        except Exception as e:
+            logger.error(f"Erreur extraction batch données structurées: {e}")
+
+        # Fallback: ré-extraction individuelle des documents manquants
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            logger.warning(f"Batch incomplet: {len(missing)}/{len(docs)} documents ré-extraits un par un")
+            fallbacks = await asyncio.gather(*[
+                self.extract_structured_data(docs[i][1], docs[i][0], topic_context)
+                for i in missing
+            ])
+            for i, structured in zip(missing, fallbacks):
+                results[i] = structured
+
+        logger.info(f"✓ Données extraites en lot: {len(docs)} documents")
+        return results
+
+    @staticmethod
+    def _build_structured_data(extracted: Dict[str, Any], source_url: str) -> StructuredData:
+        """Construit un StructuredData depuis le JSON renvoyé par le LLM."""
+        numerical = [
+            NumericalData(**n) for n in extracted.get("numerical", [])
+        ]
+        temporal = [
+            TemporalData(**t) for t in extracted.get("temporal", [])
+        ]
+        entities = [
+            EntityData(**e) for e in extracted.get("entities", [])
+        ]
+        relationships = [
+            RelationshipData(**r) for r in extracted.get("relationships", [])
+        ]
+
+        # Calculer confiance globale
+        all_confidences = (
+            [n.confidence for n in numerical] +
+            [t.confidence for t in temporal] +
+            [e.confidence for e in entities] +
+            [r.confidence for r in relationships]
+        )
+        overall_confidence = (
+            sum(all_confidences) / len(all_confidences)
+            if all_confidences else 0.0
+        )
+
+        return StructuredData(
+            source_url=source_url,
+            numerical=numerical,
+            temporal=temporal,
+            entities=entities,
+            relationships=relationships,
+            extraction_timestamp=datetime.now().isoformat(),
+            overall_confidence=overall_confidence
+        )
+
+    @staticmethod
+    def _empty_structured_data(source_url: str) -> StructuredData:
+        """Structure vide utilisée en cas d'échec d'extraction."""
         return StructuredData(
             source_url=source_url,
             numerical=[],
@@ -297,6 +401,43 @@ class DataValidator:
 
         return common_metrics
 
+    @staticmethod
+    def find_common_metrics_flat(
+        numerical: Iterable[Tuple[Dict[str, Any], str]]
+    ) -> Dict[str, List[NumericalData]]:
+        """
+        Variante de find_common_metrics sur des données numériques déjà sérialisées.
+
+        Groupe en une seule passe des couples (dict NumericalData, source_url) sans
+        reconstruire de StructuredData; seuls les groupes retenus (>= 2 valeurs)
+        sont convertis en NumericalData.
+        """
+        groups: Dict[str, List[Tuple[Dict[str, Any], str]]] = defaultdict(list)
+        for num, source_url in numerical:
+            metric = num.get("metric")
+            if metric and isinstance(num.get("value"), (int, float)):
+                groups[metric.lower().strip()].append((num, source_url))
+
+        common_metrics = {}
+        for metric_key, entries in groups.items():
+            if len(entries) < 2:
+                continue
+
+            values = []
+            for num, source_url in entries:
+                try:
+                    num_data = NumericalData(**num)
+                except TypeError:
+                    continue
+                # Tracer la source si la phrase source est absente
+                num_data.source_sentence = num_data.source_sentence or source_url
+                values.append(num_data)
+
+            if len(values) >= 2:
+                common_metrics[metric_key] = values
+
+        return common_metrics
+
     @staticmethod
     def validate_numerical_coherence(
         metrics: Dict[str, List[NumericalData]]
@@ -3,8 +3,9 @@ Client LLM pour Albert API.
 Adapté depuis Colaig pour être autonome et réutilisable.
 """
 
+import json
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
 from langchain_core.callbacks.manager import AsyncCallbackManagerForLLMRun
@@ -91,6 +92,53 @@ class AlbertLLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"Erreur lors de la génération: {str(e)}")
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Génère une réponse en streaming (Server-Sent Events, format OpenAI).
+
+        La connexion est fermée dès que le générateur est fermé par l'appelant.
+
+        Yields:
+            Fragments successifs du texte généré
+        """
+        url = f"{self.base_url}/v1/chat/completions"
+
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            **kwargs
+        }
+
+        try:
+            async with self.http_client.stream("POST", url, json=data) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+
+                    choices = json.loads(payload).get("choices") or []
+                    if choices:
+                        content = (choices[0].get("delta") or {}).get("content")
+                        if content:
+                            yield content
+
+        except httpx.HTTPStatusError as e:
+            raise LLMClientError(f"Erreur HTTP {e.response.status_code}")
+        except Exception as e:
+            raise LLMClientError(f"Erreur lors de la génération: {str(e)}")
+
+    def json_mode_params(self) -> Dict[str, Any]:
+        """API compatible OpenAI (vLLM): response_format json_object."""
+        return {"response_format": {"type": "json_object"}}
+
     def get_langchain_wrapper(self) -> BaseChatModel:
         """
         Retourne un wrapper LangChain pour browser-use.
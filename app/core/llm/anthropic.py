@@ -2,7 +2,7 @@
 Client LLM pour Anthropic API (Claude).
 """
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
 from anthropic import AsyncAnthropic
@@ -38,6 +38,37 @@ class AnthropicLLMClient(BaseLLMClient):
 
         self.client = AsyncAnthropic(**kwargs)
 
+    def _build_params(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """Construit les paramètres de l'API Anthropic (message système séparé)."""
+        # Anthropic nécessite un message système séparé
+        system_message = None
+        filtered_messages = []
+
+        for msg in messages:
+            if msg["role"] == "system":
+                system_message = msg["content"]
+            else:
+                filtered_messages.append(msg)
+
+        # Paramètres pour l'API Anthropic
+        api_params = {
+            "model": self.model,
+            "messages": filtered_messages,
+            "max_tokens": kwargs.pop("max_tokens", 4096),
+            **kwargs
+        }
+
+        if system_message:
+            # Bloc système marqué cacheable: les prompts système statiques
+            # (planification, etc.) réutilisent le préfixe en cache côté API
+            api_params["system"] = [{
+                "type": "text",
+                "text": system_message,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
+        return api_params
+
     async def generate(
         self,
         messages: List[Dict[str, str]],
@@ -54,27 +85,7 @@ class AnthropicLLMClient(BaseLLMClient):
             Contenu de la réponse générée
         """
         try:
-            # Anthropic nécessite un message système séparé
-            system_message = None
-            filtered_messages = []
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    filtered_messages.append(msg)
-
-            # Paramètres pour l'API Anthropic
-            api_params = {
-                "model": self.model,
-                "messages": filtered_messages,
-                "max_tokens": kwargs.pop("max_tokens", 4096),
-                **kwargs
-            }
-
-            if system_message:
-                api_params["system"] = system_message
-
+            api_params = self._build_params(messages, **kwargs)
             response = await self.client.messages.create(**api_params)
 
             if response.content and len(response.content) > 0:
@@ -85,6 +96,29 @@ class AnthropicLLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"Erreur lors de la génération Anthropic: {str(e)}")
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Génère une réponse en streaming avec Claude.
+
+        La sortie du context manager (fermeture du générateur par l'appelant)
+        interrompt la génération côté API.
+
+        Yields:
+            Fragments successifs du texte généré
+        """
+        api_params = self._build_params(messages, **kwargs)
+
+        try:
+            async with self.client.messages.stream(**api_params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise LLMClientError(f"Erreur lors de la génération Anthropic: {str(e)}")
+
     def get_langchain_wrapper(self) -> BaseChatModel:
         """
         Retourne un wrapper LangChain pour browser-use.
@@ -4,7 +4,7 @@ Permet l'abstraction des différents providers (Albert, OpenAI, Anthropic, etc.)
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from langchain_core.language_models import BaseChatModel
 
 
@@ -45,6 +45,39 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Génère une réponse fragment par fragment (streaming).
+
+        Implémentation par défaut pour les providers sans streaming: la réponse
+        complète est renvoyée en un seul fragment. Fermer le générateur
+        (aclose) interrompt la génération côté provider quand il streame.
+
+        Args:
+            messages: Liste de messages au format {"role": "user/assistant/system", "content": "..."}
+            **kwargs: Paramètres additionnels spécifiques au provider
+
+        Yields:
+            Fragments successifs du texte généré
+        """
+        yield await self.generate(messages, **kwargs)
+
+    def json_mode_params(self) -> Dict[str, Any]:
+        """
+        Paramètres de génération imposant une sortie JSON valide (mode JSON du provider).
+
+        Par défaut aucun: le provider n'a pas de mode JSON et le prompt seul
+        demande du JSON (l'appelant garde son parsing tolérant).
+
+        Returns:
+            kwargs à ajouter à generate/generate_stream
+        """
+        return {}
+
     @abstractmethod
     def get_langchain_wrapper(self) -> BaseChatModel:
         """
@@ -2,7 +2,7 @@
 Client LLM pour OpenAI API.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models import BaseChatModel
 from openai import AsyncOpenAI
@@ -67,6 +67,42 @@ class OpenAILLMClient(BaseLLMClient):
         except Exception as e:
             raise LLMClientError(f"Erreur lors de la génération OpenAI: {str(e)}")
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Génère une réponse en streaming avec OpenAI.
+
+        Le flux HTTP est fermé dès que le générateur est fermé par l'appelant.
+
+        Yields:
+            Fragments successifs du texte généré
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                **kwargs
+            )
+        except Exception as e:
+            raise LLMClientError(f"Erreur lors de la génération OpenAI: {str(e)}")
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise LLMClientError(f"Erreur lors de la génération OpenAI: {str(e)}")
+        finally:
+            await stream.close()
+
+    def json_mode_params(self) -> Dict[str, Any]:
+        """Mode JSON natif de l'API (response_format json_object)."""
+        return {"response_format": {"type": "json_object"}}
+
     def get_langchain_wrapper(self) -> BaseChatModel:
         """
         Retourne un wrapper LangChain pour browser-use.
@@ -26,6 +26,8 @@ from app.api.v1.endpoints import research as research_old
 from app.api.v1.endpoints import search, research_quick, research_deep
 
 from app.api.models import HealthResponse
+from app.services.search_service import searxng_client
+from app.agents.research_agent import close_http_client as close_research_http_client
 from app.core.browser.playwright_manager import ensure_playwright_installed, is_playwright_available
 
 # Configuration du logging
@@ -54,6 +56,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Arrêt de Webtools Service...")
+    await searxng_client.close()
+    await close_research_http_client()
 
 
 # Créer l'application FastAPI
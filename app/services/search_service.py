@@ -34,8 +34,19 @@ class SearXNGClient:
             base_url: URL de base de l'instance SearXNG
         """
         self.base_url = base_url
+        # Client HTTP partagé (keep-alive): créé au premier appel, fermé par close()
+        self._http_client: Optional[httpx.AsyncClient] = None
         logger.info(f"SearXNG client initialized with base_url: {base_url}")
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Retourne le client HTTP poolé, en le (re)créant si nécessaire."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
+        return self._http_client
+
     async def search(
         self,
         query: str,
@@ -73,29 +84,28 @@ class SearXNGClient:
         try:
             logger.info(f"Searching SearXNG for: {query}")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/search",
-                    params=params
-                )
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Extraire les résultats
-                results = []
-                for r in data.get("results", [])[:max_results]:
-                    results.append(SearchResult(
-                        url=r.get("url", ""),
-                        title=r.get("title", ""),
-                        content=r.get("content", ""),
-                        engine=r.get("engine", ""),
-                        score=r.get("score", 0.0),
-                        category=r.get("category", "general")
-                    ))
-
-                logger.info(f"Found {len(results)} results for query: {query}")
-                return results
+            response = await self._get_http_client().get(
+                f"{self.base_url}/search",
+                params=params
+            )
+            response.raise_for_status()
+
+            data = response.json()
+
+            # Extraire les résultats
+            results = []
+            for r in data.get("results", [])[:max_results]:
+                results.append(SearchResult(
+                    url=r.get("url", ""),
+                    title=r.get("title", ""),
+                    content=r.get("content", ""),
+                    engine=r.get("engine", ""),
+                    score=r.get("score", 0.0),
+                    category=r.get("category", "general")
+                ))
+
+            logger.info(f"Found {len(results)} results for query: {query}")
+            return results
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during SearXNG search: {e}")
@@ -112,13 +122,18 @@ class SearXNGClient:
             True si SearXNG répond, False sinon
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/")
-                return response.status_code == 200
+            response = await self._get_http_client().get(f"{self.base_url}/", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"SearXNG health check failed: {e}")
             return False
 
+    async def close(self):
+        """Ferme le client HTTP partagé."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
 # Instance globale du client
 searxng_client = SearXNGClient()
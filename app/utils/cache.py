@@ -0,0 +1,59 @@
+"""
+Cache mémoire LRU avec expiration (TTL).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Cache clé/valeur borné en taille (éviction LRU) avec durée de vie par entrée.
+
+    Les entrées expirées sont purgées paresseusement à la lecture.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        """
+        Args:
+            maxsize: Nombre maximum d'entrées conservées
+            ttl: Durée de vie d'une entrée en secondes
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur associée à la clé, ou None si absente ou expirée."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Enregistre une valeur (TTL par défaut du cache si non précisé)."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Retire une entrée et retourne sa valeur (default si absente)."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Vide le cache."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
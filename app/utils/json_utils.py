@@ -0,0 +1,130 @@
+"""
+Utilitaires de parsing JSON pour les réponses LLM.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+# Décodeur partagé (sans état): évite d'en construire un à chaque extraction
+_JSON_DECODER = json.JSONDecoder()
+
+
+def extract_json(text: str, start_char: str = "{") -> Optional[Any]:
+    """
+    Extrait le premier objet (ou tableau) JSON valide contenu dans un texte.
+
+    Utilise le scanner C de json.JSONDecoder.raw_decode à chaque position
+    candidate: gère correctement les accolades présentes dans les chaînes.
+
+    Args:
+        text: Texte brut (réponse LLM, éventuellement entourée de prose ou de ```json)
+        start_char: "{" pour un objet, "[" pour un tableau
+
+    Returns:
+        L'objet JSON décodé, ou None si aucun JSON valide n'est trouvé
+    """
+    if not text:
+        return None
+
+    idx = text.find(start_char)
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            return obj
+        except json.JSONDecodeError:
+            idx = text.find(start_char, idx + 1)
+
+    return None
+
+
+class IncrementalJsonParser:
+    """
+    Détecteur incrémental de fin de JSON pour les réponses streamées.
+
+    Alimenté fragment par fragment, il suit la profondeur d'imbrication en
+    tenant compte des chaînes et des échappements: chaque caractère n'est
+    examiné qu'une fois. Quand un candidat se ferme, il est décodé; en cas
+    d'échec (accolades présentes dans la prose), la recherche reprend après.
+    """
+
+    _TOKEN_RE = re.compile(r'["\\{}\[\]]')
+
+    def __init__(self, start_char: str = "{"):
+        """
+        Args:
+            start_char: "{" pour un objet, "[" pour un tableau
+        """
+        self.start_char = start_char
+        self.end_char = "}" if start_char == "{" else "]"
+        self.result: Optional[Any] = None
+        self.done = False
+        self.start = -1
+        self.end = -1
+
+        self._parts: List[str] = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        """Texte reçu jusqu'ici."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Ajoute un fragment et indique si un JSON complet et valide a été reçu.
+
+        Returns:
+            True dès que le JSON est complet (self.result contient l'objet décodé)
+        """
+        if self.done:
+            return True
+
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+        # Caractère échappé à cheval sur deux fragments
+        skip = 1 if self._escape else 0
+        self._escape = False
+
+        for match in self._TOKEN_RE.finditer(chunk):
+            i = match.start()
+            if i < skip:
+                continue
+            ch = match.group()
+
+            if self.start == -1:
+                if ch == self.start_char:
+                    self.start = offset + i
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if ch == "\\":
+                    skip = i + 2
+                    self._escape = skip > len(chunk)
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == self.start_char:
+                self._depth += 1
+            elif ch == self.end_char:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        # Décodage en place depuis le début du candidat (pas de copie)
+                        self.result, self.end = _JSON_DECODER.raw_decode(self.text, self.start)
+                    except json.JSONDecodeError:
+                        self.start = -1
+                        continue
+                    self.done = True
+                    return True
+
+        return False
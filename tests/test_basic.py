@@ -5,6 +5,8 @@ Tests de base pour WebExtract Service.
 import pytest
 from app.utils.content_detector import ContentDetector
 from app.utils.prompts import PromptTemplates
+from app.utils.json_utils import extract_json, IncrementalJsonParser
+from app.utils.cache import TTLCache
 
 
 def test_content_detector_github():
@@ -67,5 +69,42 @@ def test_prompt_templates_legifrance():
     assert "texte juridique" in prompt
 
 
+def test_extract_json_with_surrounding_text():
+    """Test d'extraction JSON dans une réponse LLM bavarde."""
+    response = 'Voici le plan:\n```json\n{"desc": "use {x}", "steps": [1, 2]}\n```'
+    assert extract_json(response) == {"desc": "use {x}", "steps": [1, 2]}
+
+
+def test_extract_json_invalid():
+    """Test d'extraction JSON sans objet valide."""
+    assert extract_json("pas de json {ici") is None
+    assert extract_json("") is None
+
+
+def test_incremental_json_parser_chunks():
+    """Test de détection de fin de JSON sur une réponse streamée."""
+    parser = IncrementalJsonParser()
+    chunks = ['Voici {le plan}: {"a": {"b"', ': "}"}, "c', '": 1} et du texte', ' ignoré']
+    complete = [parser.feed(chunk) for chunk in chunks]
+    assert complete == [False, False, True, True]
+    assert parser.result == {"a": {"b": "}"}, "c": 1}
+    assert parser.text[parser.start:parser.end] == '{"a": {"b": "}"}, "c": 1}'
+
+
+def test_ttl_cache_lru_eviction():
+    """Test d'éviction LRU et d'expiration du cache."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" devient la plus récente
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.set("d", 4, ttl=-1)
+    assert cache.get("d") is None
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "absent") == "absent"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])